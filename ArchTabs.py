@@ -25,16 +25,13 @@ from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction, QFileDialog, QTableWidgetItem
 from qgis.core import (QgsProject, QgsMapLayer, QgsLayerTreeGroup,
-                       QgsLayerTreeLayer, QgsVectorLayer, QgsMessageLog, Qgis)
-from typing import Dict, List, Union
-
-# Initialize Qt resources from file resources.py
-from .resources import *
-# Import the code for the dialog
-from .ArchTabs_dialog import ArchTabsDialog
-from .utils.xl_loader import XlHandler
+                       QgsLayerTreeLayer, QgsVectorLayer, QgsMessageLog, Qgis,
+                       QgsApplication, QgsTask)
+from typing import Dict, List, Tuple, Union
+
+# Dialog, resources, processing provider and export modules are imported on
+# first use, plugin load only registers the action.
 from .utils.logger import log
-from .utils.data_handler import DataHandler
 import os.path
 from itertools import chain
 
@@ -93,6 +90,12 @@ class ArchTabs:
         self.multi_warn = None
         self.rem_button = None
         self.surf_check = None
+        self.parcel_check = None
+        self.parcel_field = None
+        self.per_file_check = None
+        self.replace_check = None
+        self.geodesic_check = None
+        self.run_layers = list()
         self.surf_label = None
         self.surf_box = None
         self.de_button = None
@@ -104,6 +107,9 @@ class ArchTabs:
         self.t_points_err = None
         self.file_err = None
         self.success = None
+        self.progress_bar = None
+        self.task = None
+        self.provider = None
 
 
     # noinspection PyMethodMayBeStatic
@@ -196,10 +202,20 @@ class ArchTabs:
 
         return action
 
+    def initProcessing(self):
+        """Registers processing provider, also used by qgis_process."""
+        if self.provider is not None:
+            return
+        from .processing_provider.provider import ArchTabsProvider
+        self.provider = ArchTabsProvider()
+        QgsApplication.processingRegistry().addProvider(self.provider)
+
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
+        self.initProcessing()
 
-        icon_path = ':/plugins/ArchTabs/icon.png'
+        # file path, resources.py is not loaded before run()
+        icon_path = os.path.join(self.plugin_dir, 'icon.png')
         self.add_action(
             icon_path,
             text=self.tr(u'archtabs'),
@@ -212,6 +228,11 @@ class ArchTabs:
 
     def unload(self):
         """Removes the plugin menu item and icon from QGIS GUI."""
+        if self.task is not None:
+            self.task.cancel()
+        if self.provider is not None:
+            QgsApplication.processingRegistry().removeProvider(self.provider)
+            self.provider = None
         for action in self.actions:
             self.iface.removePluginVectorMenu(
                 self.tr(u'&ArchTabs'),
@@ -220,7 +241,8 @@ class ArchTabs:
 
     def select_output_file(self) -> None:
         filename, _filter = QFileDialog.getSaveFileName(
-            self.dlg, "Select output file", "", '*.xls')
+            self.dlg, "Select output file", "",
+            "Excel 97-2003 (*.xls);;Excel workbook (*.xlsx)")
         self.output_file = filename
         self.dlg.FileLine.setText(self.output_file)
 
@@ -265,6 +287,7 @@ class ArchTabs:
             for field in t_points.fields():
                 t_points_fields.append(field.name())
             self.turn_order.addItems(t_points_fields)
+            self.parcel_field.addItems(t_points_fields)
             landmarks = self.proj.mapLayersByName(self.landmarks_box.
                                                   currentText())[0]
             landmarks_fields = list()
@@ -280,12 +303,14 @@ class ArchTabs:
     def show_fields(self, key: str) -> None:
         if key is "points" and self.turn_order:
             self.turn_order.clear()
+            self.parcel_field.clear()
             t_points = self.proj.mapLayersByName(self.turning_p_box.
                                                  currentText())[0]
             t_points_fields = list()
             for field in t_points.fields():
                 t_points_fields.append(field.name())
             self.turn_order.addItems(t_points_fields)
+            self.parcel_field.addItems(t_points_fields)
         elif key is "names" and self.land_names:
             self.land_names.clear()
             landmarks = self.proj.mapLayersByName(self.landmarks_box.
@@ -300,6 +325,7 @@ class ArchTabs:
         self.landmarks_box.clear()
         self.bench_box.clear()
         self.turn_order.clear()
+        self.parcel_field.clear()
         self.land_names.clear()
         self.surf_box.clear()
 
@@ -378,6 +404,11 @@ class ArchTabs:
             self.surf_label.setEnabled(False)
             self.surf_box.setEnabled(False)
 
+    def parcel_checkbox(self):
+        checked = self.parcel_check.isChecked()
+        self.parcel_field.setEnabled(checked)
+        self.per_file_check.setEnabled(checked)
+
     def get_lang(self) -> str:
         if self.de_button.isChecked():
             return "Deutsch"
@@ -386,40 +417,28 @@ class ArchTabs:
         return "Russian"
 
     def get_basic_values(self) -> Dict[str, any]:
-        values = dict()
         if self.proj_check.isChecked():
-            values["crs"] = self.proj.crs()
+            crs = self.proj.crs()
         else:
-            values["crs"] = self.crs_box.crs()
+            crs = self.crs_box.crs()
         t_points = self.proj.mapLayersByName(self.turning_p_box.
                                              currentText())[0]
-        values["t_points"] = t_points
-        points_order = t_points.fields()[self.turn_order.currentIndex()]
-        idx = t_points.fields().indexFromName(points_order.name())
-        points_list = [feature.attributes()[idx] for feature in
-                       t_points.getFeatures()]
-        values["order"] = points_list
-        fields = [f.name() for f in t_points.fields()]
-        values["order_name"] = fields[fields.index(
-            self.turn_order.currentText())]
         landmarks = self.proj.mapLayersByName(self.landmarks_box.
                                               currentText())[0]
-        values["landmarks"] = landmarks
-        land_list = [f.name() for f in landmarks.fields()]
-        land_field = land_list[land_list.index(self.land_names.currentText())]
-        idx = landmarks.fields().indexFromName(land_field)
-        names_list = [feature.attributes()[idx] for feature in
-                      landmarks.getFeatures()]
-        values["names"] = names_list
-
         benchmark = self.proj.mapLayersByName(self.bench_box.
                                               currentText())[0]
-        values["benchmark"] = benchmark
-        values["lang"] = self.get_lang()
-        values = self.get_advanced_values(values)
-        return values
-
-    def get_advanced_values(self, values: Dict[str, any]):
+        parts, surface = self.get_advanced_values()
+        from .utils.values import build_values
+        parcel_field = None
+        if self.parcel_check.isChecked():
+            parcel_field = self.parcel_field.currentText()
+        return build_values(crs, t_points, self.turn_order.currentText(),
+                            landmarks, self.land_names.currentText(),
+                            benchmark, self.get_lang(), parts, surface,
+                            parcel_field, self.geodesic_check.isChecked())
+
+    def get_advanced_values(self) -> Tuple[List[List[int]],
+                                           List[QgsVectorLayer]]:
         data = list()
         if self.mult_check.isChecked():
             print("checked")
@@ -428,79 +447,71 @@ class ArchTabs:
                 for column in range(self.parts_table.columnCount()):
                     idx = int(self.parts_table.item(row, column).text())
                     data[row].append(idx)
-        values["parts"] = data
+        layers = list()
         if self.surf_check.isChecked():
             s_layers = self.surf_box.checkedItems()
-            layers = [self.proj.mapLayersByName(item) for item
+            layers = [self.proj.mapLayersByName(item)[0] for item
                       in s_layers]
-            values["surface"] = layers
-        return values
+        return data, layers
 
     def handle(self) -> None:
-        dh = DataHandler()
-        xl = XlHandler()
-
+        if self.task is not None:
+            self.task.cancel()
+            return
         self.success.hide()
         self.hide_errs()
-        errors = list()
-        user_data = self.get_basic_values()
-        if dh.landmarks_handler(user_data):
-            if xl.write_data(dh.landmarks_data, "landmarks"):
-                self.iface.messageBar().pushMessage("Landmarks",
-                                                    "Landmarks data recorded",
-                                                    level=Qgis.Success)
-            else:
-                self.iface.messageBar().pushMessage("Landmarks",
-                                                    "Please check landmarks",
-                                                    level=Qgis.Warning)
-        else:
-            self.iface.messageBar().pushMessage("Landmarks",
-                                                f"Please check landmarks",
-                                                level=Qgis.Critical)
-            errors.append("landmarks")
-        if dh.coord_handler(user_data):
-            if xl.write_data(dh.coord_data, "coordinates"):
-                self.iface.messageBar().pushMessage("Turning points",
-                                                    "Coordinates data recorded",
-                                                    level=Qgis.Success)
-            else:
-                self.iface.messageBar().pushMessage("Turning points",
-                                                    "Please check points",
-                                                    level=Qgis.Warning)
+        from .utils.task import ArchTabsTask
+        from .utils.profiling import RunProfiler, profiling_enabled
+        # hidden settings, run report and profile are used to find slow
+        # stages and functions
+        report = QSettings().value("ArchTabs/runReport", False, type=bool)
+        profiler = RunProfiler() if profiling_enabled() else None
+        if profiler is None:
+            user_data = self.get_basic_values()
         else:
-            errors.append("coords")
-            self.iface.messageBar().pushMessage("Turning points",
-                                                f"Please check points",
-                                                level=Qgis.Critical)
-
-        if dh.borders_handler(user_data):
-            if xl.write_data(dh.bound_data, "description"):
-                self.iface.messageBar().pushMessage("Turning points",
-                                                    "Borders data recorded",
-                                                    level=Qgis.Success)
-            else:
-                self.iface.messageBar().pushMessage("Turning points",
-                                                    "Please check points",
-                                                    level=Qgis.Warning)
-        else:
-            errors.append("borders")
-            self.iface.messageBar().pushMessage("Turning points",
-                                                f"Please check points",
-                                                level=Qgis.Critical)
-
-        if xl.save(self.output_file):
-            self.iface.messageBar().pushMessage("File",
-                                                "File recorded",
-                                                level=Qgis.Success)
-        else:
-            errors.append("file")
-            self.iface.messageBar().pushMessage("File",
-                                                f"File not recorded",
-                                                level=Qgis.Critical)
-
+            with profiler.profile():
+                user_data = self.get_basic_values()
+        self.task = ArchTabsTask(user_data, self.output_file,
+                                 self.per_file_check.isChecked(), report,
+                                 profiler)
+        self.task.progressChanged.connect(
+            lambda value: self.progress_bar.setValue(int(value)))
+        self.task.taskCompleted.connect(self.task_finished)
+        self.task.taskTerminated.connect(self.task_finished)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.run_button.setText("Cancel")
+        QgsApplication.taskManager().addTask(self.task)
+
+    def task_finished(self) -> None:
+        """ Shows results of ArchTabsTask, called in main thread """
+
+        task, self.task = self.task, None
+        self.progress_bar.hide()
+        self.run_button.setText("Run")
+        for title, text, level in task.pipeline.messages:
+            self.iface.messageBar().pushMessage(title, text, level=level)
+        self.add_run_layers(task.pipeline.layers)
+        if task.status() == QgsTask.Terminated:
+            self.iface.messageBar().pushMessage("ArchTabs", "Run canceled",
+                                                level=Qgis.Warning)
+            return
+        errors = task.pipeline.errors
         self.show_errs(errors) if len(errors) else self.success.show()
-        dh.clear_data()
 
+    def add_run_layers(self, layers: List[QgsVectorLayer]) -> None:
+        """ Adds layers of run to project with one call, layers of the
+        previous run are removed if user checks this """
+
+        if not layers:
+            return
+        if self.replace_check.isChecked():
+            previous = [layer_id for layer_id in self.run_layers
+                        if self.proj.mapLayer(layer_id) is not None]
+            if previous:
+                self.proj.removeMapLayers(previous)
+        self.proj.addMapLayers(layers)
+        self.run_layers = [layer.id() for layer in layers]
 
     def show_errs(self, errors: List[str]) -> None:
         if "landmarks" in errors:
@@ -539,6 +550,10 @@ class ArchTabs:
 
         if self.first_start:
             self.first_start = False
+            # Initialize Qt resources from file resources.py
+            from . import resources
+            # Import the code for the dialog
+            from .ArchTabs_dialog import ArchTabsDialog
             self.dlg = ArchTabsDialog()
             self.turning_p_box = self.dlg.TurningPointsBox
             self.landmarks_box = self.dlg.LandmarksBox
@@ -555,6 +570,11 @@ class ArchTabs:
             self.multi_warn = self.dlg.MultiWarn
             self.rem_button = self.dlg.RemoveButton
             self.surf_check = self.dlg.SurfaceCheckBox
+            self.parcel_check = self.dlg.ParcelCheckBox
+            self.parcel_field = self.dlg.ParcelField
+            self.per_file_check = self.dlg.PerFileCheckBox
+            self.replace_check = self.dlg.ReplaceCheckBox
+            self.geodesic_check = self.dlg.GeodesicCheckBox
             self.surf_label = self.dlg.SurfaceLabel
             self.surf_box = self.dlg.SurfaceComboBox
             self.de_button = self.dlg.Deutch
@@ -566,6 +586,7 @@ class ArchTabs:
             self.t_points_err = self.dlg.turningpointsLabel
             self.file_err = self.dlg.fileLabel
             self.success = self.dlg.successLabel
+            self.progress_bar = self.dlg.progressBar
             self.dlg.FileButton.clicked.connect(self.select_output_file)
             self.run_button.clicked.connect(self.handle)
             self.add.clicked.connect(self.insert_into_table)
@@ -578,10 +599,13 @@ class ArchTabs:
             self.mult_check.clicked.connect(lambda: self.mult_checkbox())
             self.rem_button.clicked.connect(lambda: self.clear_table())
             self.surf_check.clicked.connect(lambda: self.surface_checkbox())
+            self.parcel_check.clicked.connect(lambda: self.parcel_checkbox())
 
         self.proj = QgsProject.instance()
         self.layers = self.proj.layerTreeRoot().children()
         self.success.hide()
+        if self.task is None:
+            self.progress_bar.hide()
         self.hide_errs()
         self.clear_boxes()
         self.fill_boxes()
@@ -24,12 +24,30 @@
 
 import os
 
-from qgis.PyQt import uic
 from qgis.PyQt import QtWidgets
 
-# This loads your .ui file so that PyQt can populate your plugin with the elements from Qt Designer
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
-    os.path.dirname(__file__), 'ArchTabs_dialog_base.ui'))
+UI_FILE = os.path.join(os.path.dirname(__file__), 'ArchTabs_dialog_base.ui')
+COMPILED_UI_FILE = os.path.join(os.path.dirname(__file__),
+                                'ArchTabs_dialog_base.py')
+
+
+def ui_is_compiled():
+    """Checks that compiled UI module exists and is not older than .ui file
+    (the .ui file may be edited in development without "make compile")."""
+    try:
+        return os.path.getmtime(COMPILED_UI_FILE) >= \
+            os.path.getmtime(UI_FILE)
+    except OSError:
+        return os.path.exists(COMPILED_UI_FILE)
+
+
+if ui_is_compiled():
+    # Precompiled by "make compile", no XML parsing at start
+    from .ArchTabs_dialog_base import Ui_ArchTabsDialogBase as FORM_CLASS
+else:
+    from qgis.PyQt import uic
+    # This loads your .ui file so that PyQt can populate your plugin with the elements from Qt Designer
+    FORM_CLASS, _ = uic.loadUiType(UI_FILE)
 
 
 class ArchTabsDialog(QtWidgets.QDialog, FORM_CLASS):
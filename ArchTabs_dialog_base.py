@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ArchTabs_dialog_base.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from qgis.PyQt import QtCore, QtGui, QtWidgets
+
+
+class Ui_ArchTabsDialogBase(object):
+    def setupUi(self, ArchTabsDialogBase):
+        ArchTabsDialogBase.setObjectName("ArchTabsDialogBase")
+        ArchTabsDialogBase.resize(399, 670)
+        self.SurfaceCheckBox = QtWidgets.QCheckBox(ArchTabsDialogBase)
+        self.SurfaceCheckBox.setGeometry(QtCore.QRect(220, 390, 101, 23))
+        self.SurfaceCheckBox.setObjectName("SurfaceCheckBox")
+        self.EndSpinBox = QtWidgets.QSpinBox(ArchTabsDialogBase)
+        self.EndSpinBox.setEnabled(False)
+        self.EndSpinBox.setGeometry(QtCore.QRect(80, 440, 48, 26))
+        self.EndSpinBox.setObjectName("EndSpinBox")
+        self.label_2 = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.label_2.setGeometry(QtCore.QRect(20, 150, 121, 17))
+        self.label_2.setObjectName("label_2")
+        self.Deutch = QtWidgets.QRadioButton(ArchTabsDialogBase)
+        self.Deutch.setGeometry(QtCore.QRect(210, 310, 41, 23))
+        self.Deutch.setObjectName("Deutch")
+        self.turningpointsLabel = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.turningpointsLabel.setGeometry(QtCore.QRect(20, 130, 101, 17))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        self.turningpointsLabel.setFont(font)
+        self.turningpointsLabel.setText("")
+        self.turningpointsLabel.setObjectName("turningpointsLabel")
+        self.MultiWarn = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.MultiWarn.setEnabled(True)
+        self.MultiWarn.setGeometry(QtCore.QRect(20, 470, 111, 17))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(True)
+        font.setStyleStrategy(QtGui.QFont.PreferDefault)
+        self.MultiWarn.setFont(font)
+        self.MultiWarn.setObjectName("MultiWarn")
+        self.SurfaceComboBox = QgsCheckableComboBox(ArchTabsDialogBase)
+        self.SurfaceComboBox.setEnabled(False)
+        self.SurfaceComboBox.setGeometry(QtCore.QRect(220, 440, 160, 27))
+        self.SurfaceComboBox.setObjectName("SurfaceComboBox")
+        self.CrsBox = QgsProjectionSelectionWidget(ArchTabsDialogBase)
+        self.CrsBox.setEnabled(True)
+        self.CrsBox.setGeometry(QtCore.QRect(20, 350, 171, 27))
+        self.CrsBox.setObjectName("CrsBox")
+        self.English = QtWidgets.QRadioButton(ArchTabsDialogBase)
+        self.English.setGeometry(QtCore.QRect(270, 310, 51, 23))
+        self.English.setChecked(True)
+        self.English.setObjectName("English")
+        self.LandmarksBox = QtWidgets.QComboBox(ArchTabsDialogBase)
+        self.LandmarksBox.setGeometry(QtCore.QRect(20, 170, 231, 25))
+        self.LandmarksBox.setObjectName("LandmarksBox")
+        self.label_4 = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.label_4.setGeometry(QtCore.QRect(300, 80, 81, 17))
+        self.label_4.setObjectName("label_4")
+        self.LandmarksName = QtWidgets.QComboBox(ArchTabsDialogBase)
+        self.LandmarksName.setGeometry(QtCore.QRect(300, 170, 81, 25))
+        self.LandmarksName.setObjectName("LandmarksName")
+        self.label_7 = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.label_7.setGeometry(QtCore.QRect(20, 420, 121, 17))
+        self.label_7.setObjectName("label_7")
+        self.FileLine = QtWidgets.QLineEdit(ArchTabsDialogBase)
+        self.FileLine.setEnabled(False)
+        self.FileLine.setGeometry(QtCore.QRect(20, 30, 131, 25))
+        self.FileLine.setFocusPolicy(QtCore.Qt.ClickFocus)
+        self.FileLine.setObjectName("FileLine")
+        self.AddButton = QtWidgets.QPushButton(ArchTabsDialogBase)
+        self.AddButton.setEnabled(False)
+        self.AddButton.setGeometry(QtCore.QRect(140, 440, 51, 25))
+        self.AddButton.setObjectName("AddButton")
+        self.RemoveButton = QtWidgets.QPushButton(ArchTabsDialogBase)
+        self.RemoveButton.setEnabled(False)
+        self.RemoveButton.setGeometry(QtCore.QRect(20, 630, 61, 25))
+        self.RemoveButton.setObjectName("RemoveButton")
+        self.BenchmarkBox = QtWidgets.QComboBox(ArchTabsDialogBase)
+        self.BenchmarkBox.setGeometry(QtCore.QRect(20, 240, 231, 25))
+        self.BenchmarkBox.setObjectName("BenchmarkBox")
+        self.TurningPointsBox = QtWidgets.QComboBox(ArchTabsDialogBase)
+        self.TurningPointsBox.setGeometry(QtCore.QRect(20, 100, 231, 25))
+        self.TurningPointsBox.setObjectName("TurningPointsBox")
+        self.label_8 = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.label_8.setGeometry(QtCore.QRect(210, 290, 201, 17))
+        self.label_8.setObjectName("label_8")
+        self.label = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.label.setGeometry(QtCore.QRect(20, 80, 151, 17))
+        self.label.setObjectName("label")
+        self.label_3 = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.label_3.setGeometry(QtCore.QRect(20, 220, 131, 17))
+        self.label_3.setObjectName("label_3")
+        self.ProjectionCheck = QtWidgets.QCheckBox(ArchTabsDialogBase)
+        self.ProjectionCheck.setGeometry(QtCore.QRect(20, 320, 161, 23))
+        self.ProjectionCheck.setObjectName("ProjectionCheck")
+        self.landmarksLabel = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.landmarksLabel.setGeometry(QtCore.QRect(20, 200, 101, 17))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        self.landmarksLabel.setFont(font)
+        self.landmarksLabel.setText("")
+        self.landmarksLabel.setObjectName("landmarksLabel")
+        self.SurfaceLabel = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.SurfaceLabel.setEnabled(False)
+        self.SurfaceLabel.setGeometry(QtCore.QRect(220, 420, 141, 17))
+        self.SurfaceLabel.setObjectName("SurfaceLabel")
+        self.runButton = QtWidgets.QPushButton(ArchTabsDialogBase)
+        self.runButton.setGeometry(QtCore.QRect(260, 565, 81, 41))
+        self.runButton.setObjectName("runButton")
+        self.StartSpinBox = QtWidgets.QSpinBox(ArchTabsDialogBase)
+        self.StartSpinBox.setEnabled(False)
+        self.StartSpinBox.setGeometry(QtCore.QRect(20, 440, 48, 26))
+        self.StartSpinBox.setObjectName("StartSpinBox")
+        self.MultCheckBox = QtWidgets.QCheckBox(ArchTabsDialogBase)
+        self.MultCheckBox.setGeometry(QtCore.QRect(20, 390, 121, 23))
+        self.MultCheckBox.setObjectName("MultCheckBox")
+        self.PartsTable = QtWidgets.QTableWidget(ArchTabsDialogBase)
+        self.PartsTable.setEnabled(False)
+        self.PartsTable.setGeometry(QtCore.QRect(20, 490, 170, 131))
+        self.PartsTable.setColumnCount(2)
+        self.PartsTable.setObjectName("PartsTable")
+        self.PartsTable.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.PartsTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.PartsTable.setHorizontalHeaderItem(1, item)
+        self.successLabel = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.successLabel.setGeometry(QtCore.QRect(270, 610, 61, 20))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.successLabel.setFont(font)
+        self.successLabel.setObjectName("successLabel")
+        self.FileLabel = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.FileLabel.setGeometry(QtCore.QRect(20, 10, 121, 17))
+        font = QtGui.QFont()
+        font.setBold(False)
+        font.setUnderline(False)
+        font.setWeight(50)
+        font.setStrikeOut(False)
+        self.FileLabel.setFont(font)
+        self.FileLabel.setObjectName("FileLabel")
+        self.label_6 = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.label_6.setGeometry(QtCore.QRect(20, 290, 171, 17))
+        self.label_6.setObjectName("label_6")
+        self.TurningOrder = QtWidgets.QComboBox(ArchTabsDialogBase)
+        self.TurningOrder.setGeometry(QtCore.QRect(300, 100, 81, 25))
+        self.TurningOrder.setObjectName("TurningOrder")
+        self.Russian = QtWidgets.QRadioButton(ArchTabsDialogBase)
+        self.Russian.setGeometry(QtCore.QRect(330, 310, 51, 23))
+        self.Russian.setObjectName("Russian")
+        self.benchmarkLabel = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.benchmarkLabel.setGeometry(QtCore.QRect(20, 270, 101, 17))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        self.benchmarkLabel.setFont(font)
+        self.benchmarkLabel.setText("")
+        self.benchmarkLabel.setObjectName("benchmarkLabel")
+        self.label_5 = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.label_5.setGeometry(QtCore.QRect(300, 150, 81, 17))
+        self.label_5.setObjectName("label_5")
+        self.fileLabel = QtWidgets.QLabel(ArchTabsDialogBase)
+        self.fileLabel.setGeometry(QtCore.QRect(20, 60, 101, 17))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        self.fileLabel.setFont(font)
+        self.fileLabel.setText("")
+        self.fileLabel.setObjectName("fileLabel")
+        self.FileButton = QtWidgets.QPushButton(ArchTabsDialogBase)
+        self.FileButton.setGeometry(QtCore.QRect(160, 30, 31, 25))
+        self.FileButton.setFocusPolicy(QtCore.Qt.ClickFocus)
+        self.FileButton.setObjectName("FileButton")
+        self.progressBar = QtWidgets.QProgressBar(ArchTabsDialogBase)
+        self.progressBar.setGeometry(QtCore.QRect(220, 635, 161, 20))
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setObjectName("progressBar")
+        self.ParcelCheckBox = QtWidgets.QCheckBox(ArchTabsDialogBase)
+        self.ParcelCheckBox.setGeometry(QtCore.QRect(220, 475, 161, 23))
+        self.ParcelCheckBox.setObjectName("ParcelCheckBox")
+        self.ParcelField = QtWidgets.QComboBox(ArchTabsDialogBase)
+        self.ParcelField.setGeometry(QtCore.QRect(220, 500, 161, 25))
+        self.ParcelField.setEnabled(False)
+        self.ParcelField.setObjectName("ParcelField")
+        self.PerFileCheckBox = QtWidgets.QCheckBox(ArchTabsDialogBase)
+        self.PerFileCheckBox.setGeometry(QtCore.QRect(220, 530, 161, 23))
+        self.PerFileCheckBox.setEnabled(False)
+        self.PerFileCheckBox.setObjectName("PerFileCheckBox")
+        self.ReplaceCheckBox = QtWidgets.QCheckBox(ArchTabsDialogBase)
+        self.ReplaceCheckBox.setGeometry(QtCore.QRect(220, 350, 161, 23))
+        self.ReplaceCheckBox.setChecked(True)
+        self.ReplaceCheckBox.setObjectName("ReplaceCheckBox")
+        self.GeodesicCheckBox = QtWidgets.QCheckBox(ArchTabsDialogBase)
+        self.GeodesicCheckBox.setGeometry(QtCore.QRect(260, 240, 121, 23))
+        self.GeodesicCheckBox.setObjectName("GeodesicCheckBox")
+
+        self.retranslateUi(ArchTabsDialogBase)
+        QtCore.QMetaObject.connectSlotsByName(ArchTabsDialogBase)
+
+    def retranslateUi(self, ArchTabsDialogBase):
+        _translate = QtCore.QCoreApplication.translate
+        ArchTabsDialogBase.setWindowTitle(_translate("ArchTabsDialogBase", "ArchTabs"))
+        self.SurfaceCheckBox.setText(_translate("ArchTabsDialogBase", "Use surface"))
+        self.label_2.setText(_translate("ArchTabsDialogBase", "Select landmarks"))
+        self.Deutch.setText(_translate("ArchTabsDialogBase", "DE"))
+        self.MultiWarn.setText(_translate("ArchTabsDialogBase", "check your data"))
+        self.English.setText(_translate("ArchTabsDialogBase", "EN"))
+        self.label_4.setText(_translate("ArchTabsDialogBase", "Order field"))
+        self.label_7.setText(_translate("ArchTabsDialogBase", "Plot point range"))
+        self.AddButton.setText(_translate("ArchTabsDialogBase", "Add"))
+        self.RemoveButton.setText(_translate("ArchTabsDialogBase", "Reset"))
+        self.label_8.setText(_translate("ArchTabsDialogBase", "Output description lang"))
+        self.label.setText(_translate("ArchTabsDialogBase", "Select turning points"))
+        self.label_3.setText(_translate("ArchTabsDialogBase", "Select benchmark"))
+        self.ProjectionCheck.setText(_translate("ArchTabsDialogBase", "Use project system"))
+        self.SurfaceLabel.setText(_translate("ArchTabsDialogBase", "Select surface layers"))
+        self.runButton.setText(_translate("ArchTabsDialogBase", "Run"))
+        self.MultCheckBox.setText(_translate("ArchTabsDialogBase", "Multiple plots"))
+        item = self.PartsTable.horizontalHeaderItem(0)
+        item.setText(_translate("ArchTabsDialogBase", "start"))
+        item = self.PartsTable.horizontalHeaderItem(1)
+        item.setText(_translate("ArchTabsDialogBase", "end"))
+        self.successLabel.setText(_translate("ArchTabsDialogBase", "Complete!"))
+        self.FileLabel.setText(_translate("ArchTabsDialogBase", "Select output file"))
+        self.label_6.setText(_translate("ArchTabsDialogBase", "Select output projection"))
+        self.Russian.setText(_translate("ArchTabsDialogBase", "RU"))
+        self.label_5.setText(_translate("ArchTabsDialogBase", "Name field"))
+        self.FileButton.setText(_translate("ArchTabsDialogBase", "..."))
+        self.ParcelCheckBox.setText(_translate("ArchTabsDialogBase", "Batch by parcel"))
+        self.PerFileCheckBox.setText(_translate("ArchTabsDialogBase", "File per parcel"))
+        self.ReplaceCheckBox.setText(_translate("ArchTabsDialogBase", "Replace previous layers"))
+        self.GeodesicCheckBox.setToolTip(_translate("ArchTabsDialogBase", "Calculate border lengths and azimuths on the ellipsoid of output projection"))
+        self.GeodesicCheckBox.setText(_translate("ArchTabsDialogBase", "Geodesic"))
+from qgis.gui import QgsCheckableComboBox
+from qgis.gui import QgsProjectionSelectionWidget
@@ -0,0 +1,282 @@
+from qgis.core import (QgsProcessing, QgsProcessingAlgorithm,
+                       QgsProcessingContext, QgsProcessingException,
+                       QgsProcessingFeedback, QgsProcessingParameterBoolean,
+                       QgsProcessingParameterCrs,
+                       QgsProcessingParameterEnum, QgsProcessingParameterField,
+                       QgsProcessingParameterFileDestination,
+                       QgsProcessingParameterMultipleLayers,
+                       QgsProcessingParameterString,
+                       QgsProcessingParameterVectorLayer,
+                       QgsProcessingOutputMultipleLayers, Qgis)
+from typing import Dict, List, Sequence
+
+from ..utils.values import LANGUAGES, build_values
+
+
+def parse_parts(text: str) -> List[List[int]]:
+    """
+    Converts ranges of border parts like "1-12;13-20" to the list used by
+    DataHandler.
+
+    :param text: ranges of points separated by ";" or ","
+    :type text: str
+    :rtype: List[List[int]]
+    """
+
+    parts = list()
+    for item in text.replace(",", ";").split(";"):
+        if not item.strip():
+            continue
+        start, end = (int(num) for num in item.split("-"))
+        if start > end:
+            start, end = end, start
+        parts.append([start, end])
+    return parts
+
+
+class ArchTabsAlgorithm(QgsProcessingAlgorithm):
+    """
+    Base class of ArchTabs algorithms. Subclasses select pipeline stages,
+    parameters are added for the selected stages only. Input layers are
+    read in prepareAlgorithm, which runs in main thread, processAlgorithm
+    may run in a worker thread and uses only the prepared data.
+
+    Args:
+        self.stages: keys of Pipeline stages
+        self.run_values: dict of interface data of current run
+    """
+
+    TURNING_POINTS = "TURNING_POINTS"
+    ORDER_FIELD = "ORDER_FIELD"
+    LANDMARKS = "LANDMARKS"
+    NAMES_FIELD = "NAMES_FIELD"
+    BENCHMARK = "BENCHMARK"
+    SURFACE = "SURFACE"
+    PARTS = "PARTS"
+    GEODESIC = "GEODESIC"
+    PARCEL_FIELD = "PARCEL_FIELD"
+    PER_FILE = "PER_FILE"
+    CRS = "CRS"
+    LANGUAGE = "LANGUAGE"
+    NUMERIC = "NUMERIC"
+    INLINE_STRINGS = "INLINE_STRINGS"
+    OUTPUT = "OUTPUT"
+    REPORT = "REPORT"
+    LAYERS = "LAYERS"
+
+    stages: Sequence[str] = ("landmarks", "coords", "borders")
+    run_values: Dict[str, any] = None
+
+    def createInstance(self) -> QgsProcessingAlgorithm:
+        return type(self)()
+
+    def group(self) -> str:
+        return "ArchTabs"
+
+    def groupId(self) -> str:
+        return "archtabs"
+
+    def initAlgorithm(self, config=None) -> None:
+        points = {"coords", "borders"}.intersection(self.stages)
+        if points:
+            self.addParameter(QgsProcessingParameterVectorLayer(
+                self.TURNING_POINTS, "Turning points",
+                [QgsProcessing.TypeVectorPoint]))
+            self.addParameter(QgsProcessingParameterField(
+                self.ORDER_FIELD, "Order field",
+                parentLayerParameterName=self.TURNING_POINTS))
+            self.addParameter(QgsProcessingParameterField(
+                self.PARCEL_FIELD, "Parcel id field (batch mode)",
+                parentLayerParameterName=self.TURNING_POINTS,
+                optional=True))
+            self.addParameter(QgsProcessingParameterBoolean(
+                self.PER_FILE, "File per parcel", False))
+        if "landmarks" in self.stages:
+            self.addParameter(QgsProcessingParameterVectorLayer(
+                self.LANDMARKS, "Landmarks",
+                [QgsProcessing.TypeVectorPoint]))
+            self.addParameter(QgsProcessingParameterField(
+                self.NAMES_FIELD, "Name field",
+                parentLayerParameterName=self.LANDMARKS))
+            self.addParameter(QgsProcessingParameterVectorLayer(
+                self.BENCHMARK, "Benchmark",
+                [QgsProcessing.TypeVectorPoint]))
+        if "borders" in self.stages:
+            self.addParameter(QgsProcessingParameterMultipleLayers(
+                self.SURFACE, "Surface layers",
+                QgsProcessing.TypeVectorAnyGeometry, optional=True))
+            self.addParameter(QgsProcessingParameterString(
+                self.PARTS, "Plot point ranges (e.g. 1-12;13-20)",
+                optional=True))
+            self.addParameter(QgsProcessingParameterBoolean(
+                self.GEODESIC, "Geodesic lengths and azimuths", False))
+        self.addParameter(QgsProcessingParameterCrs(
+            self.CRS, "Output projection", "ProjectCrs"))
+        self.addParameter(QgsProcessingParameterEnum(
+            self.LANGUAGE, "Output description lang", LANGUAGES,
+            defaultValue=LANGUAGES.index("Russian")))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.NUMERIC, "Export angles as decimal degrees", False))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.INLINE_STRINGS, "Write xlsx strings inline (less memory, "
+            "larger file)", False))
+        self.addParameter(QgsProcessingParameterFileDestination(
+            self.OUTPUT, "Output file",
+            "Excel 97-2003 (*.xls);;Excel workbook (*.xlsx)"))
+        self.addParameter(QgsProcessingParameterFileDestination(
+            self.REPORT, "Run report", "JSON files (*.json)", optional=True,
+            createByDefault=False))
+        self.addOutput(QgsProcessingOutputMultipleLayers(
+            self.LAYERS, "Layers"))
+
+    def values(self, parameters: Dict[str, any],
+               context: QgsProcessingContext) -> Dict[str, any]:
+        """
+        This method converts algorithm parameters to the dict of interface
+        data.
+
+        :param parameters: algorithm parameters
+        :type parameters: Dict[str, any]
+        :param context: processing context
+        :type context: QgsProcessingContext
+        :rtype: Dict[str, any]
+        """
+
+        t_points = landmarks = benchmark = order = names = None
+        parcel_field = None
+        geodesic = False
+        parts, surface = list(), list()
+        if self.TURNING_POINTS in parameters:
+            t_points = self.parameterAsVectorLayer(
+                parameters, self.TURNING_POINTS, context)
+            order = self.parameterAsString(parameters, self.ORDER_FIELD,
+                                           context)
+            parcel_field = self.parameterAsString(
+                parameters, self.PARCEL_FIELD, context) or None
+        if self.LANDMARKS in parameters:
+            landmarks = self.parameterAsVectorLayer(
+                parameters, self.LANDMARKS, context)
+            names = self.parameterAsString(parameters, self.NAMES_FIELD,
+                                           context)
+            benchmark = self.parameterAsVectorLayer(
+                parameters, self.BENCHMARK, context)
+        if "borders" in self.stages:
+            surface = self.parameterAsLayerList(parameters, self.SURFACE,
+                                                context)
+            parts = parse_parts(self.parameterAsString(
+                parameters, self.PARTS, context))
+            geodesic = self.parameterAsBoolean(parameters, self.GEODESIC,
+                                               context)
+        lang = LANGUAGES[self.parameterAsEnum(parameters, self.LANGUAGE,
+                                              context)]
+        return build_values(self.parameterAsCrs(parameters, self.CRS,
+                                                context),
+                            t_points, order, landmarks, names, benchmark,
+                            lang, parts, surface, parcel_field, geodesic,
+                            context.transformContext())
+
+    def prepareAlgorithm(self, parameters: Dict[str, any],
+                         context: QgsProcessingContext,
+                         feedback: QgsProcessingFeedback) -> bool:
+        self.run_values = self.values(parameters, context)
+        return True
+
+    def processAlgorithm(self, parameters: Dict[str, any],
+                         context: QgsProcessingContext,
+                         feedback: QgsProcessingFeedback) -> Dict[str, any]:
+        # pipeline modules are imported when an algorithm runs, not when
+        # provider is registered at plugin load
+        from ..utils.task import Pipeline
+        output = self.parameterAsFileOutput(parameters, self.OUTPUT, context)
+        per_file = False
+        if self.TURNING_POINTS in parameters:
+            per_file = self.parameterAsBoolean(parameters, self.PER_FILE,
+                                               context)
+        numeric = self.parameterAsBoolean(parameters, self.NUMERIC, context)
+        report = self.parameterAsFileOutput(parameters, self.REPORT, context)
+        # unchecked option leaves the choice to the pipeline (see
+        # Pipeline.inline)
+        inline = self.parameterAsBoolean(parameters, self.INLINE_STRINGS,
+                                         context)
+        pipeline = Pipeline(self.run_values, output,
+                            self.stages, per_file, numeric, report or None,
+                            inline_strings=inline or None)
+        if not pipeline.run(feedback.setProgress, feedback.isCanceled):
+            return {}
+        if report:
+            for line in pipeline.report.lines():
+                feedback.pushInfo(line)
+        for title, text, level in pipeline.messages:
+            if level == Qgis.Critical:
+                feedback.reportError(f"{title}: {text}")
+            else:
+                feedback.pushInfo(f"{title}: {text}")
+        if pipeline.errors:
+            raise QgsProcessingException(
+                f"Failed stages: {', '.join(pipeline.errors)}")
+        layers = list()
+        for layer in pipeline.layers:
+            context.temporaryLayerStore().addMapLayer(layer)
+            context.addLayerToLoadOnCompletion(
+                layer.id(), QgsProcessingContext.LayerDetails(
+                    layer.name(), context.project(), self.LAYERS))
+            layers.append(layer.id())
+        result = {self.OUTPUT: output, self.LAYERS: layers}
+        if report:
+            result[self.REPORT] = report
+        return result
+
+
+class LandmarksAlgorithm(ArchTabsAlgorithm):
+    stages = ("landmarks",)
+
+    def name(self) -> str:
+        return "landmarks"
+
+    def displayName(self) -> str:
+        return "Landmarks description"
+
+    def shortHelpString(self) -> str:
+        return "Writes azimuths and distances from benchmark to landmarks."
+
+
+class CoordinatesAlgorithm(ArchTabsAlgorithm):
+    stages = ("coords",)
+
+    def name(self) -> str:
+        return "coordinates"
+
+    def displayName(self) -> str:
+        return "Turning points coordinates"
+
+    def shortHelpString(self) -> str:
+        return "Writes coordinates of turning points in output projection " \
+               "and in EPSG:4326."
+
+
+class BordersAlgorithm(ArchTabsAlgorithm):
+    stages = ("borders",)
+
+    def name(self) -> str:
+        return "borders"
+
+    def displayName(self) -> str:
+        return "Border description"
+
+    def shortHelpString(self) -> str:
+        return "Writes description of border segments between turning " \
+               "points."
+
+
+class ExportAlgorithm(ArchTabsAlgorithm):
+    stages = ("landmarks", "coords", "borders")
+
+    def name(self) -> str:
+        return "export"
+
+    def displayName(self) -> str:
+        return "Export all"
+
+    def shortHelpString(self) -> str:
+        return "Writes landmarks, coordinates and border description " \
+               "into one workbook."
@@ -0,0 +1,25 @@
+from qgis.core import QgsProcessingProvider
+from qgis.PyQt.QtGui import QIcon
+import os.path
+
+from .algorithms import (LandmarksAlgorithm, CoordinatesAlgorithm,
+                         BordersAlgorithm, ExportAlgorithm)
+
+
+class ArchTabsProvider(QgsProcessingProvider):
+    """ Processing provider which exposes ArchTabs pipeline stages """
+
+    def loadAlgorithms(self) -> None:
+        for algorithm in (LandmarksAlgorithm, CoordinatesAlgorithm,
+                          BordersAlgorithm, ExportAlgorithm):
+            self.addAlgorithm(algorithm())
+
+    def id(self) -> str:
+        return "archtabs"
+
+    def name(self) -> str:
+        return "ArchTabs"
+
+    def icon(self) -> QIcon:
+        return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                  "icon.png"))
@@ -0,0 +1,15 @@
+#!/bin/bash
+PYUIC=$1
+UI_FILES=$2
+
+
+for UI_FILE in ${UI_FILES}
+do
+    echo "Processing: ${UI_FILE}"
+    # pyuic imports QGIS custom widgets by their C++ header names and uses
+    # PyQt5 directly, imports are rewritten to qgis.gui and qgis.PyQt.
+    $PYUIC -o ${UI_FILE%.ui}.py ${UI_FILE}
+    sed -i -e 's/^from PyQt5 import/from qgis.PyQt import/' \
+        -e 's/^from qgs[a-z]* import \(Qgs[A-Za-z]*\)$/from qgis.gui import \1/' \
+        ${UI_FILE%.ui}.py
+done
@@ -0,0 +1,315 @@
+# coding=utf-8
+"""Benchmarks of DataHandler stages and Excel export.
+
+Every stage runs on synthetic data (synthetic_data.py) of given sizes
+(number of turning points), its best wall time of several runs and its
+peak traced memory are compared with the stored baseline
+(benchmark_baseline.json). The script
+exits with 1 if any stage is slower or takes more memory than baseline by
+more than tolerance, or if a measured stage has no baseline yet (record it
+with --update). Stages which need QGIS (border lines, crossing checks,
+coordinates, landmark rows) are skipped if qgis is not importable. Stages
+listed in "pending" of baseline have no recorded values yet, they are
+reported but do not fail; --update removes a stage from the list when
+it is recorded for all default sizes.
+
+Usage:
+    PYTHONPATH=. python test/benchmark.py [--sizes 100,10000,1000000]
+        [--repeat 5] [--tolerance 2.0] [--update]
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from utils import kernels
+from utils.results import ResultTable, bound_table, coord_table
+from utils.xl_loader import XlHandler
+from synthetic_data import CENTER, CRS, landmark_points, parcel_points
+
+BASELINE = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+SIZES = (100, 10000, 1000000)
+# differences below NOISE seconds are not reported as regressions
+NOISE = 0.02
+WGS84 = (6378137.0, 1 / 298.257223563)
+# rows limit of Excel 97-2003 sheet
+XLS_ROWS = 65536
+# crossing surface of QGIS stages has as many roads as turning points,
+# but not more than SURFACE_FEATURES
+SURFACE_FEATURES = 100000
+QGIS_APP = None
+
+
+def border_points(count: int) -> Tuple[np.ndarray, np.ndarray]:
+    xs, ys, _ranges = parcel_points(count)
+    return xs, ys
+
+
+def border_table(count: int) -> ResultTable:
+    xs, ys = border_points(count)
+    azimuths, lengths = kernels.segments(xs, ys)
+    numbers = np.arange(1, count + 1)
+    table = bound_table()
+    table.extend("From", numbers)
+    table.extend("To", np.roll(numbers, -1))
+    table.extend("Desc", (f"Segment {num}" for num in range(count)))
+    table.extend("Az", azimuths)
+    table.extend("Len", lengths)
+    return table
+
+
+def points_table(count: int) -> ResultTable:
+    xs, ys = border_points(count)
+    table = coord_table()
+    table.extend("Nm", range(1, count + 1))
+    table.extend("X", ys / 100000)
+    table.extend("Y", xs / 100000)
+    table.extend("X1", ys)
+    table.extend("Y1", xs)
+    return table
+
+
+def kernel_stages(count: int) -> Dict[str, Callable[[], any]]:
+    """
+    Returns stages which run without QGIS. Input data is prepared here, so
+    only stage itself is measured.
+
+    :param count: number of turning points
+    :type count: int
+    :rtype: Dict[str, Callable[[], any]]
+    """
+
+    xs, ys = border_points(count)
+    lons, lats = xs / 100000, ys / 100000
+    land_xs, land_ys = landmark_points(count)
+    table = border_table(count)
+    coords = points_table(count)
+    stages = {
+        "segments": lambda: kernels.az_to_str(
+            kernels.segments(xs, ys)[0], "Russian"),
+        "landmarks": lambda: kernels.decimal_to_dms(kernels.bearings(
+            *CENTER, land_xs, land_ys)[0]),
+        "geodesic_segments": lambda: kernels.geodesic_segments(
+            lons, lats, *WGS84),
+        "decimal_to_dms": lambda: kernels.decimal_to_dms(lats),
+        "result_rows": lambda: sum(1 for _row in table.rows()),
+        "write_xlsx": lambda: write_workbook(".xlsx", table, coords),
+        "write_xlsx_inline": lambda: write_workbook(
+            ".xlsx", table, coords, inline_strings=True),
+    }
+    if count <= XLS_ROWS:
+        stages["write_xls"] = lambda: write_workbook(".xls", table, coords)
+    return stages
+
+
+def write_workbook(ext: str, *tables: ResultTable,
+                   inline_strings: bool = False) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, f"benchmark{ext}")
+        xl = XlHandler(filename, inline_strings)
+        for num, table in enumerate(tables):
+            if not xl.write_data(table, f"sheet{num}"):
+                raise RuntimeError("Sheet is not written")
+        if not xl.save(filename):
+            raise RuntimeError("Workbook is not saved")
+
+
+def qgis_stages(count: int) -> Dict[str, Callable[[], any]]:
+    """
+    Returns stages which need QGIS, empty dict if qgis is not importable.
+    Layers are built with synthetic_data.dataset and read with build_values
+    like in plugin, crossing surface has count roads (at most
+    SURFACE_FEATURES).
+
+    :param count: number of turning points
+    :type count: int
+    :rtype: Dict[str, Callable[[], any]]
+    """
+
+    try:
+        from qgis.core import QgsApplication, QgsCoordinateReferenceSystem
+    except ImportError:
+        return dict()
+    from synthetic_data import NAME_FIELD, ORDER_FIELD, dataset
+    from utils.data_handler import DataHandler
+    from utils.values import build_values
+    global QGIS_APP  # pylint: disable=W0603
+    if QgsApplication.instance() is None:
+        QGIS_APP = QgsApplication([], False)
+        QGIS_APP.initQgis()
+    crs = QgsCoordinateReferenceSystem(CRS)
+    layers = dataset(count, landmarks=count,
+                     surface={"roads": min(count, SURFACE_FEATURES)})
+    values = build_values(crs, layers["turning_points"], ORDER_FIELD,
+                          layers["landmarks"], NAME_FIELD,
+                          layers["benchmark"], surface=[layers["roads"]])
+    snapshot = values["snapshots"]["t_points"]
+
+    def border_lines(surface: bool) -> None:
+        stage_values = dict(values)
+        if not surface:
+            stage_values["surface"] = list()
+        DataHandler().border_lines([1, len(snapshot)], snapshot,
+                                   stage_values)
+
+    def coord_handler() -> None:
+        if not DataHandler().coord_handler(values):
+            raise RuntimeError("Coordinates handler failed")
+
+    return {"border_lines": lambda: border_lines(False),
+            "check_if_crosses": lambda: border_lines(True),
+            "coord_handler": coord_handler,
+            "landmark_rows": lambda: DataHandler().landmark_rows(values)}
+
+
+def measure(stage: Callable[[], any], repeat: int) -> Dict[str, float]:
+    """
+    Returns best wall time of stage runs and peak traced memory of one
+    more run. Stage output (error_handler prints) is dropped.
+
+    :param stage: stage function
+    :type stage: Callable[[], any]
+    :param repeat: number of timed runs
+    :type repeat: int
+    :rtype: Dict[str, float]
+    """
+
+    times = list()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            stage()
+            times.append(time.perf_counter() - start)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            stage()
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {"time": min(times), "peak": peak}
+
+
+def run(sizes: List[int], repeat: int) -> Dict[str, Dict[str, float]]:
+    results = dict()
+    for count in sizes:
+        stages = kernel_stages(count)
+        stages.update(qgis_stages(count))
+        for name, stage in stages.items():
+            result = measure(stage, repeat)
+            results[f"{name}:{count}"] = result
+            print(f"{name + ':' + str(count):<28}{result['time']:>10.4f} s"
+                  f"{result['peak'] / 2 ** 20:>10.1f} MiB")
+    return results
+
+
+def regressions(results: Dict[str, Dict[str, float]],
+                baseline: Dict[str, Dict[str, float]],
+                tolerance: float,
+                pending: List[str] = ()) -> List[str]:
+    """
+    Returns descriptions of stages which are slower or take more memory
+    than baseline by more than tolerance and of stages missing in
+    baseline. Missing stages which are listed in pending (their baseline
+    is not recorded yet) are only printed.
+
+    :param results: measured stages
+    :type results: Dict[str, Dict[str, float]]
+    :param baseline: baseline stages
+    :type baseline: Dict[str, Dict[str, float]]
+    :param tolerance: allowed ratio of result to baseline
+    :type tolerance: float
+    :param pending: names of stages without recorded baseline
+    :type pending: List[str]
+    :rtype: List[str]
+    """
+
+    failed = list()
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None and key.split(":")[0] in pending:
+            print(f"PENDING {key} has no baseline yet, record it with "
+                  f"--update")
+            continue
+        if base is None:
+            failed.append(f"{key} has no baseline, run with --update")
+            continue
+        if result["time"] > base["time"] * tolerance and \
+                result["time"] - base["time"] > NOISE:
+            failed.append(f"{key} time {result['time']:.4f} s, baseline "
+                          f"{base['time']:.4f} s")
+        if result["peak"] > base["peak"] * tolerance:
+            failed.append(f"{key} peak memory {result['peak']} B, baseline "
+                          f"{base['peak']} B")
+    return failed
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="comma separated numbers of turning points")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timed runs of every stage")
+    parser.add_argument("--tolerance", type=float, default=2.0,
+                        help="allowed ratio of result to baseline")
+    parser.add_argument("--baseline", default=BASELINE,
+                        help="baseline json file")
+    parser.add_argument("--update", action="store_true",
+                        help="write results as new baseline")
+    args = parser.parse_args(argv)
+    results = run([int(size) for size in args.sizes.split(",")],
+                  args.repeat)
+    if args.update:
+        baseline = dict()
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as file:
+                baseline = json.load(file)
+        baseline.setdefault("stages", dict()).update(results)
+        baseline["pending"] = [
+            name for name in baseline.get("pending", ())
+            if any(f"{name}:{size}" not in baseline["stages"]
+                   for size in SIZES)]
+        baseline["machine"] = f"{platform.machine()} " \
+                              f"{platform.python_implementation()} " \
+                              f"{platform.python_version()} " \
+                              f"numpy {np.__version__}"
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=1, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline {args.baseline}, run with --update")
+        return 1
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    failed = regressions(results, baseline["stages"], args.tolerance,
+                         baseline.get("pending", ()))
+    for text in failed:
+        print(f"REGRESSION {text}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
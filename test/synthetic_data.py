@@ -0,0 +1,316 @@
+# coding=utf-8
+"""Synthetic cadastral datasets for load testing.
+
+Coordinates are generated with numpy and are deterministic by seed, layers
+(turning points, landmarks, benchmark and surface roads, rivers and
+parcels) are created as memory layers and may be written to a GeoPackage.
+Layers need QGIS, coordinate generators do not.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# UTM zone 37N like plane
+CENTER = (500000.0, 6000000.0)
+CRS = "EPSG:32637"
+ORDER_FIELD = "num"
+NAME_FIELD = "name"
+PARCEL_FIELD = "parcel"
+SURFACE_KINDS = ("roads", "rivers", "parcels")
+
+
+def parcel_points(count: int, seed: int = 0, parts: int = 1,
+                  center: Tuple[float, float] = CENTER,
+                  radius: float = 1000.0) -> Tuple[np.ndarray, np.ndarray,
+                                                   List[List[int]]]:
+    """
+    Generates turning points of a border of several parts. Every part is a
+    star shaped ring without self intersections, parts are placed side by
+    side. Points are returned in border order with ranges of parts
+    (1 based, inclusive) like in "Plot point range" table.
+
+    :param count: number of points of all parts
+    :type count: int
+    :param seed: random seed
+    :type seed: int
+    :param parts: number of border parts
+    :type parts: int
+    :param center: center of the first part
+    :type center: Tuple[float, float]
+    :param radius: radius of parts
+    :type radius: float
+    :rtype: Tuple[np.ndarray, np.ndarray, List[List[int]]]
+    """
+
+    if count < 3 * parts:
+        raise ValueError(f"{parts} parts need at least {3 * parts} points")
+    rng = np.random.default_rng(seed)
+    sizes = [count // parts + (num < count % parts) for num in range(parts)]
+    xs, ys, ranges = list(), list(), list()
+    start = 1
+    for num, size in enumerate(sizes):
+        angles = np.sort(rng.uniform(0, 2 * np.pi, size))
+        radii = radius * rng.uniform(0.8, 1.0, size)
+        xs.append(center[0] + 3 * radius * num + radii * np.sin(angles))
+        ys.append(center[1] + radii * np.cos(angles))
+        ranges.append([start, start + size - 1])
+        start += size
+    return np.concatenate(xs), np.concatenate(ys), ranges
+
+
+def landmark_points(count: int, seed: int = 0,
+                    center: Tuple[float, float] = CENTER,
+                    radius: float = 1000.0) -> Tuple[np.ndarray,
+                                                     np.ndarray]:
+    """
+    Generates landmarks in a ring from 2 to 10 radii around center.
+
+    :param count: number of landmarks
+    :type count: int
+    :param seed: random seed
+    :type seed: int
+    :param center: center of parcel
+    :type center: Tuple[float, float]
+    :param radius: radius of parcel
+    :type radius: float
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    rng = np.random.default_rng(seed + 1)
+    angles = rng.uniform(0, 2 * np.pi, count)
+    radii = radius * rng.uniform(2.0, 10.0, count)
+    return center[0] + radii * np.sin(angles), \
+        center[1] + radii * np.cos(angles)
+
+
+def surface_lines(kind: str, count: int, seed: int = 0,
+                  center: Tuple[float, float] = CENTER,
+                  extent: float = 5000.0,
+                  vertices: int = 20) -> List[np.ndarray]:
+    """
+    Generates surface geometries as arrays of (x, y) vertices. Roads are
+    almost straight lines across the extent, rivers are meandering random
+    walks and parcels are closed rings of a jittered grid.
+
+    :param kind: one of SURFACE_KINDS
+    :type kind: str
+    :param count: number of geometries
+    :type count: int
+    :param seed: random seed
+    :type seed: int
+    :param center: center of extent
+    :type center: Tuple[float, float]
+    :param extent: half size of square extent
+    :type extent: float
+    :param vertices: number of vertices of roads and rivers
+    :type vertices: int
+    :rtype: List[np.ndarray]
+    """
+
+    rng = np.random.default_rng(seed + 2 + SURFACE_KINDS.index(kind))
+    origin = np.array(center)
+    result = list()
+    if kind == "parcels":
+        side = max(int(np.ceil(np.sqrt(count))), 1)
+        cell = 2 * extent / side
+        square = np.array([[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]) * cell
+        for num in range(count):
+            corner = origin - extent + cell * np.array(divmod(num, side))
+            ring = corner + square + rng.uniform(-0.1, 0.1, (5, 2)) * cell
+            ring[-1] = ring[0]
+            result.append(ring)
+        return result
+    steps = np.linspace(-extent, extent, vertices)
+    for _ in range(count):
+        angle = rng.uniform(0, np.pi)
+        shift = rng.uniform(-extent, extent)
+        if kind == "roads":
+            side = rng.normal(0, extent / 200, vertices)
+        else:
+            side = np.cumsum(rng.normal(0, extent / 20, vertices))
+        along = np.array([np.sin(angle), np.cos(angle)])
+        across = np.array([along[1], -along[0]])
+        result.append(origin + np.outer(steps, along) +
+                      np.outer(shift + side, across))
+    return result
+
+
+def dataset(points: int, landmarks: int = 10, seed: int = 0,
+            parts: int = 1, parcels: int = 1,
+            surface: Dict[str, int] = None,
+            crs: str = CRS) -> Dict[str, any]:
+    """
+    Creates memory layers of a synthetic cadastral dataset. Turning points
+    have order field (restarted in every parcel) and parcel id field,
+    landmarks have name field. Returned dict has layers by name
+    ("turning_points", "landmarks", "benchmark" and surface kinds) and
+    "parts" ranges of the first parcel.
+
+    :param points: number of turning points of every parcel
+    :type points: int
+    :param landmarks: number of landmarks
+    :type landmarks: int
+    :param seed: random seed
+    :type seed: int
+    :param parts: number of border parts of every parcel
+    :type parts: int
+    :param parcels: number of parcels (batch mode)
+    :type parcels: int
+    :param surface: dict of surface kind and number of its geometries
+    :type surface: Dict[str, int]
+    :param crs: crs of layers
+    :type crs: str
+    :rtype: Dict[str, any]
+    """
+
+    from qgis.core import QgsGeometry, QgsPointXY
+    result: Dict[str, any] = dict()
+    xs, ys, orders, ids = list(), list(), list(), list()
+    for num in range(parcels):
+        center = (CENTER[0], CENTER[1] + 4000.0 * num)
+        part_xs, part_ys, ranges = parcel_points(points, seed + num, parts,
+                                                 center)
+        xs.extend(part_xs.tolist())
+        ys.extend(part_ys.tolist())
+        orders.extend(range(1, len(part_xs) + 1))
+        ids.extend([f"P{num + 1}"] * len(part_xs))
+        if not num:
+            result["parts"] = ranges
+    result["turning_points"] = point_layer(
+        "turning_points", xs, ys, {ORDER_FIELD: orders, PARCEL_FIELD: ids},
+        crs)
+    land_xs, land_ys = landmark_points(landmarks, seed)
+    result["landmarks"] = point_layer(
+        "landmarks", land_xs.tolist(), land_ys.tolist(),
+        {NAME_FIELD: [f"Landmark {num}" for num in range(1, landmarks + 1)]},
+        crs)
+    result["benchmark"] = point_layer("benchmark", [CENTER[0]],
+                                      [CENTER[1]], dict(), crs)
+    for kind, count in (surface or dict()).items():
+        geometries = list()
+        for vertices in surface_lines(kind, count, seed):
+            line = [QgsPointXY(x, y) for x, y in vertices.tolist()]
+            geometries.append(QgsGeometry.fromPolygonXY([line])
+                              if kind == "parcels" else
+                              QgsGeometry.fromPolylineXY(line))
+        result[kind] = geometry_layer(
+            "Polygon" if kind == "parcels" else "Linestring", kind,
+            geometries, crs)
+    return result
+
+
+def field_type(values: Sequence[any]) -> str:
+    return "integer" if len(values) and isinstance(values[0], int) \
+        else "string"
+
+
+def point_layer(name: str, xs: Sequence[float], ys: Sequence[float],
+                fields: Dict[str, Sequence[any]],
+                crs: str) -> "QgsVectorLayer":
+    """
+    Creates memory point layer, field types are taken from first values.
+
+    :param name: layer name
+    :type name: str
+    :param xs: x coordinates
+    :type xs: Sequence[float]
+    :param ys: y coordinates
+    :type ys: Sequence[float]
+    :param fields: dict of field name and its values
+    :type fields: Dict[str, Sequence[any]]
+    :param crs: crs of layer
+    :type crs: str
+    :rtype: QgsVectorLayer
+    """
+
+    from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
+    uri = f"Point?crs={crs}" + "".join(
+        f"&field={field}:{field_type(values)}"
+        for field, values in fields.items())
+    layer = QgsVectorLayer(uri, name, "memory")
+    features = list()
+    columns = list(fields.values())
+    for num, (x, y) in enumerate(zip(xs, ys)):
+        feature = QgsFeature(layer.fields())
+        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(x, y)))
+        feature.setAttributes([column[num] for column in columns])
+        features.append(feature)
+    layer.dataProvider().addFeatures(features)
+    layer.updateExtents()
+    return layer
+
+
+def geometry_layer(geometry: str, name: str, geometries: List[any],
+                   crs: str) -> "QgsVectorLayer":
+    from qgis.core import QgsFeature, QgsVectorLayer
+    layer = QgsVectorLayer(f"{geometry}?crs={crs}", name, "memory")
+    features = list()
+    for item in geometries:
+        feature = QgsFeature()
+        feature.setGeometry(item)
+        features.append(feature)
+    layer.dataProvider().addFeatures(features)
+    layer.updateExtents()
+    return layer
+
+
+def save_geopackage(layers: Dict[str, any], filename: str) -> None:
+    """
+    Writes dataset layers into GeoPackage, one table per layer.
+
+    :param layers: dataset from dataset function
+    :type layers: Dict[str, any]
+    :param filename: GeoPackage file
+    :type filename: str
+    """
+
+    from qgis.core import (QgsProject, QgsVectorFileWriter,
+                           QgsVectorLayer)
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    for name, layer in layers.items():
+        if not isinstance(layer, QgsVectorLayer):
+            continue
+        options.layerName = name
+        error = QgsVectorFileWriter.writeAsVectorFormatV2(
+            layer, filename, QgsProject.instance().transformContext(),
+            options)[0]
+        if error != QgsVectorFileWriter.NoError:
+            raise IOError(f"Layer {name} is not written to {filename}")
+        options.actionOnExistingFile = \
+            QgsVectorFileWriter.CreateOrOverwriteLayer
+
+
+if __name__ == "__main__":
+    import argparse
+    from qgis.core import QgsApplication
+    parser = argparse.ArgumentParser(
+        description="Writes synthetic cadastral dataset to GeoPackage")
+    parser.add_argument("filename", help="output GeoPackage")
+    parser.add_argument("--points", type=int, default=1000,
+                        help="turning points of every parcel")
+    parser.add_argument("--landmarks", type=int, default=10)
+    parser.add_argument("--parts", type=int, default=1)
+    parser.add_argument("--parcels", type=int, default=1)
+    parser.add_argument("--surface", type=int, default=10,
+                        help="geometries of every surface kind")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    app = QgsApplication([], False)
+    app.initQgis()
+    save_geopackage(dataset(args.points, args.landmarks, args.seed,
+                            args.parts, args.parcels,
+                            dict.fromkeys(SURFACE_KINDS, args.surface)),
+                    args.filename)
+    app.exitQgis()
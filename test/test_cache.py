@@ -0,0 +1,69 @@
+# coding=utf-8
+"""Layer cache invalidation test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import unittest
+
+from qgis.core import (QgsCoordinateReferenceSystem, QgsProject,
+                       QgsVectorLayer)
+
+from utils.cache import LayerCache
+
+from .utilities import get_qgis_app
+QGIS_APP = get_qgis_app()
+
+
+class LayerCacheTest(unittest.TestCase):
+    """Test entries are dropped when source layers change."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.cache = LayerCache()
+        self.crs = QgsCoordinateReferenceSystem("EPSG:32637")
+        self.layer = QgsVectorLayer("Point?crs=EPSG:32637", "points",
+                                    "memory")
+
+    def test_data_changed(self):
+        """Test data change bumps version and drops entries."""
+        key = self.cache.key([self.layer], self.crs, "names")
+        self.cache.put(key, "rows")
+        self.assertEqual(self.cache.get(key), "rows")
+        self.layer.dataChanged.emit()
+        self.assertIsNone(self.cache.get(key))
+        new_key = self.cache.key([self.layer], self.crs, "names")
+        self.assertNotEqual(new_key, key)
+        self.assertEqual(self.cache.versions[self.layer.id()], 1)
+
+    def test_stale_put(self):
+        """Test result of changed layer is not stored."""
+        key = self.cache.key([self.layer], self.crs)
+        self.layer.setCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
+        self.cache.put(key, "rows")
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(self.cache.entries, {})
+
+    def test_forget(self):
+        """Test removed layer is forgotten."""
+        key = self.cache.key([self.layer], self.crs)
+        self.cache.put(key, "rows")
+        layer_id = self.layer.id()
+        QgsProject.instance().addMapLayer(self.layer)
+        QgsProject.instance().removeMapLayer(layer_id)
+        self.assertNotIn(layer_id, self.cache.versions)
+        self.assertIsNone(self.cache.get(key))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(LayerCacheTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,86 @@
+# coding=utf-8
+"""Surface crossing engine test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import unittest
+
+from qgis.core import (QgsCoordinateReferenceSystem, QgsFeature,
+                       QgsGeometry, QgsProject, QgsVectorLayer)
+
+from utils.crossing import CrossingEngine, SurfaceSource
+
+from .utilities import get_qgis_app
+QGIS_APP = get_qgis_app()
+
+
+def line_layer(name, crs, lines):
+    """Creates memory line layer from WKT lines."""
+    layer = QgsVectorLayer(f"Linestring?crs={crs}", name, "memory")
+    features = list()
+    for wkt in lines:
+        feature = QgsFeature()
+        feature.setGeometry(QgsGeometry.fromWkt(wkt))
+        features.append(feature)
+    layer.dataProvider().addFeatures(features)
+    layer.updateExtents()
+    return layer
+
+
+class CrossingEngineTest(unittest.TestCase):
+    """Test surface layers crossed by border segments are found."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.crs = QgsCoordinateReferenceSystem("EPSG:32637")
+        self.context = QgsProject.instance().transformContext()
+        self.diagonal = QgsGeometry.fromWkt(
+            "LINESTRING (500000 5900000, 600000 6000000)")
+
+    def engine(self, *layers):
+        """Builds engine of surface layers in output crs."""
+        return CrossingEngine([SurfaceSource(layer, self.crs, self.context)
+                               for layer in layers])
+
+    def test_bbox_candidate(self):
+        """Test line inside segment bbox which is not crossed."""
+        roads = line_layer("roads", "EPSG:32637", [
+            "LINESTRING (590000 5910000, 595000 5905000)"])
+        engine = self.engine(roads)
+        self.assertEqual(engine.crossed_layers(self.diagonal), [])
+
+    def test_layer_once(self):
+        """Test layer with two crossed lines is reported once."""
+        roads = line_layer("roads", "EPSG:32637", [
+            "LINESTRING (590000 5910000, 595000 5905000)"])
+        rivers = line_layer("rivers", "EPSG:32637", [
+            "LINESTRING (500000 6000000, 600000 5900000)",
+            "LINESTRING (520000 5900000, 520000 6000000)"])
+        engine = self.engine(roads, rivers)
+        self.assertEqual(engine.crossed_layers(self.diagonal), ["rivers"])
+
+    def test_reprojected(self):
+        """Test surface layer in other crs is read in output crs."""
+        roads = line_layer("roads", "EPSG:4326", [
+            "LINESTRING (38.9 54, 39.1 54)"])
+        far = line_layer("far", "EPSG:4326", [
+            "LINESTRING (39.5 54, 39.6 54)"])
+        engine = self.engine(roads, far)
+        segment = QgsGeometry.fromWkt(
+            "LINESTRING (500000 5900000, 500000 6100000)")
+        self.assertEqual(engine.crossed_layers(segment), ["roads"])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(CrossingEngineTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
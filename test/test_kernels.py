@@ -0,0 +1,78 @@
+# coding=utf-8
+"""Border segments kernels test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import unittest
+
+import numpy as np
+
+from utils import kernels
+
+
+class KernelsTest(unittest.TestCase):
+    """Test vectorized azimuths, lengths and their text."""
+
+    def test_segments(self):
+        """Test azimuths and lengths of closed border."""
+        xs = np.array([0.0, 0.0, 10.0, 10.0])
+        ys = np.array([0.0, 10.0, 10.0, 0.0])
+        azimuths, lengths = kernels.segments(xs, ys)
+        self.assertEqual(azimuths.tolist(), [0.0, 90.0, 180.0, 270.0])
+        self.assertEqual(lengths.tolist(), [10.0, 10.0, 10.0, 10.0])
+
+    def test_bearings(self):
+        """Test azimuths and distances from benchmark."""
+        azimuths, lengths = kernels.bearings(
+            1.0, 1.0, np.array([1.0, 4.0, 1.0, -2.0]),
+            np.array([3.0, 1.0, -1.0, 1.0]))
+        self.assertEqual(azimuths.tolist(), [0.0, 90.0, 180.0, 270.0])
+        self.assertEqual(lengths.tolist(), [2.0, 3.0, 2.0, 3.0])
+
+    def test_geodesic_inverse(self):
+        """Test Vincenty example (Flinders Peak - Buninyong, GRS 80)."""
+        azimuths, lengths = kernels.geodesic_inverse(
+            np.array([144.42486788889, 10.0]), np.array([-37.95103341667,
+                                                         50.0]),
+            np.array([143.92649552778, 10.0]), np.array([-37.65282113889,
+                                                         50.0]),
+            6378137.0, 1 / 298.257222101)
+        self.assertAlmostEqual(azimuths[0], 306.868159, 5)
+        self.assertAlmostEqual(lengths[0], 54972.271, 3)
+        self.assertEqual(lengths[1], 0.0)
+
+    def test_geodesic_segments(self):
+        """Test segments along meridian and equator."""
+        azimuths, lengths = kernels.geodesic_segments(
+            np.array([0.0, 0.0, 1.0]), np.array([0.0, 1.0, 0.0]),
+            6378137.0, 1 / 298.257223563)
+        self.assertAlmostEqual(azimuths[0], 0.0)
+        self.assertAlmostEqual(lengths[0], 110574.389, 3)
+        self.assertAlmostEqual(azimuths[2], 270.0)
+        self.assertAlmostEqual(lengths[2], 111319.491, 3)
+
+    def test_decimal_to_dms(self):
+        """Test deg-min-sec format."""
+        result = kernels.decimal_to_dms(np.array([45.5, 10.25]))
+        self.assertEqual(result, ["45°30'0.0''", "10°15'0.0''"])
+
+    def test_az_to_str(self):
+        """Test sector bounds of compass points."""
+        azimuths = np.array([0.0, 11.25, 11.3, 90.0, 348.7, 348.75])
+        self.assertEqual(kernels.az_to_str(azimuths, "English"),
+                         ["N", "N", "NNE", "E", "NNW", "N"])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(KernelsTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,66 @@
+# coding=utf-8
+"""Run profiler test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import os
+import pstats
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from utils.profiling import PROFILE_ENV, RunProfiler, profiling_enabled
+
+
+def squares(count):
+    return sum(num * num for num in range(count))
+
+
+class RunProfilerTest(unittest.TestCase):
+    """Test merged profiles of run parts."""
+
+    def test_threads(self):
+        """Test profiles of main and task threads are merged."""
+        profiler = RunProfiler()
+        with profiler.profile():
+            squares(1000)
+
+        def task():
+            with profiler.profile():
+                squares(1000)
+
+        thread = threading.Thread(target=task)
+        thread.start()
+        thread.join()
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "run.prof")
+            profiler.save(filename)
+            stats = pstats.Stats(filename)
+        calls = [value[1] for key, value in stats.stats.items()
+                 if key[2] == "squares"]
+        self.assertEqual(calls, [2])
+        self.assertTrue(any("squares" in line
+                            for line in profiler.summary("tottime")))
+
+    def test_enabled(self):
+        """Test environment switch."""
+        with mock.patch.dict(os.environ, {PROFILE_ENV: "1"}):
+            self.assertTrue(profiling_enabled())
+        with mock.patch.dict(os.environ, {PROFILE_ENV: "0"}):
+            self.assertFalse(profiling_enabled())
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(RunProfilerTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
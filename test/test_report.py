@@ -0,0 +1,107 @@
+# coding=utf-8
+"""Run report test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import json
+import os
+import tempfile
+import unittest
+
+from utils import report
+from utils.decorators import HandlerCanceled, error_handler
+from utils.xl_loader import XlHandler
+
+
+@error_handler("Outer")
+def outer(size):
+    report.count("features", size)
+    inner()
+    data = bytearray(size)
+    return len(data)
+
+
+@error_handler("Inner")
+def inner():
+    report.count("predicates", 2)
+    raise ValueError("bad data")
+
+
+@error_handler("Canceled")
+def canceled():
+    raise HandlerCanceled("Run canceled")
+
+
+class RunReportTest(unittest.TestCase):
+    """Test stages records of error_handler."""
+
+    def test_stages(self):
+        """Test nested stages, counters and failures."""
+        run = report.RunReport(trace_memory=True)
+        run.activate()
+        try:
+            self.assertTrue(outer(2 ** 20))
+        finally:
+            run.deactivate()
+        self.assertIsNone(report.active())
+        inner_record, outer_record = run.stages
+        self.assertEqual(inner_record.name, "Inner")
+        self.assertFalse(inner_record.success)
+        self.assertEqual(inner_record.error, "ValueError: bad data")
+        self.assertEqual(inner_record.counters, {"predicates": 2})
+        self.assertEqual(outer_record.counters, {"features": 2 ** 20})
+        self.assertGreaterEqual(outer_record.peak, 2 ** 20)
+        self.assertLess(inner_record.peak, 2 ** 20)
+        self.assertGreaterEqual(outer_record.wall, inner_record.wall)
+        self.assertEqual(run.totals()["Inner"]["failures"], 1)
+
+    def test_inactive(self):
+        """Test handlers run without report."""
+        self.assertTrue(outer(10))
+        report.count("features")
+
+    def test_canceled(self):
+        """Test cancel passes through handler and is not a failure."""
+        run = report.RunReport()
+        run.activate()
+        try:
+            with self.assertRaises(HandlerCanceled):
+                canceled()
+        finally:
+            run.deactivate()
+        self.assertEqual(run.totals()["Canceled"]["failures"], 0)
+
+    def test_save(self):
+        """Test JSON report of Excel stages."""
+        run = report.RunReport()
+        run.activate()
+        try:
+            xl = XlHandler()
+            xl.write_data({"A": [1, 2, 3]}, "sheet")
+        finally:
+            run.deactivate()
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, "report.json")
+            run.save(filename)
+            with open(filename, encoding="utf-8") as file:
+                data = json.load(file)
+        total = data["totals"]["Excel write sheets"]
+        self.assertEqual(total["calls"], 1)
+        self.assertEqual(total["counters"], {"rows": 3})
+        self.assertIsNone(total["peak"])
+        self.assertEqual(len(run.lines()), 2)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(RunReportTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
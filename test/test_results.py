@@ -0,0 +1,71 @@
+# coding=utf-8
+"""Result tables test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import unittest
+
+import numpy as np
+
+from utils import kernels
+from utils.results import CHUNK_ROWS, bound_table, coord_table
+
+
+class ResultTableTest(unittest.TestCase):
+    """Test columnar storage and deferred formatting of results."""
+
+    def test_extend(self):
+        """Test columns grow and views are not copied."""
+        table = coord_table()
+        table.reserve(2)
+        table.extend("X1", np.array([1.23456, 2.0]))
+        table.extend("X1", [3.5])
+        column = table.column("X1")
+        self.assertEqual(column.tolist(), [1.23456, 2.0, 3.5])
+        self.assertTrue(np.shares_memory(column, table.columns["X1"]))
+        self.assertFalse(column.flags.writeable)
+        self.assertEqual(len(table), 3)
+        table.clear()
+        self.assertEqual(len(table), 0)
+
+    def test_rows(self):
+        """Test rows are formatted on export, short columns are None."""
+        table = bound_table()
+        azimuths = np.array([10.5, 359.99])
+        table.extend("From", [1, 2])
+        table.extend("To", [2, 1])
+        table.extend("Desc", ["a"])
+        table.extend("Az", azimuths)
+        table.extend("Len", [1.005, 12.3456])
+        rows = list(table.rows())
+        directions = kernels.decimal_to_dms(azimuths)
+        self.assertEqual(rows, [[1, 2, "a", directions[0], 1.0],
+                                [2, 1, None, directions[1], 12.35]])
+        numeric = list(table.rows(numeric=True))
+        self.assertEqual([row[3] for row in numeric], [10.5, 359.99])
+
+    def test_chunks(self):
+        """Test rows of several chunks keep their order."""
+        table = coord_table()
+        count = CHUNK_ROWS * 2 + 3
+        table.extend("Nm", range(count))
+        table.extend("Y1", np.arange(count, dtype=float))
+        rows = list(table.rows())
+        self.assertEqual(len(rows), count)
+        self.assertEqual([row[0] for row in rows], list(range(count)))
+        self.assertEqual([row[4] for row in rows], list(range(count)))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ResultTableTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,88 @@
+# coding=utf-8
+"""Layer snapshot and parcels split test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import unittest
+
+from qgis.core import (NULL, QgsFeature, QgsField, QgsGeometry, QgsPointXY,
+                       QgsVectorLayer)
+from qgis.PyQt.QtCore import QVariant
+
+from utils.snapshot import LayerSnapshot
+from utils.values import split_parcels
+
+from .utilities import get_qgis_app
+QGIS_APP = get_qgis_app()
+
+
+def points_layer(rows):
+    """Returns memory layer of (x, num, parcel) rows."""
+    layer = QgsVectorLayer("Point?crs=EPSG:32637", "points", "memory")
+    provider = layer.dataProvider()
+    provider.addAttributes([QgsField("num", QVariant.Int),
+                            QgsField("parcel", QVariant.String)])
+    layer.updateFields()
+    features = list()
+    for x, num, parcel in rows:
+        feature = QgsFeature(layer.fields())
+        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(x, 0)))
+        feature.setAttributes([num, parcel])
+        features.append(feature)
+    provider.addFeatures(features)
+    return layer
+
+
+class LayerSnapshotTest(unittest.TestCase):
+    """Test snapshot order, groups and batch split."""
+
+    def setUp(self):
+        """Runs before each test."""
+        layer = points_layer([(0, 3, "b"), (1, NULL, "a"), (2, 1, "b"),
+                              (3, 2, NULL), (4, 4, "a")])
+        self.snapshot = LayerSnapshot.from_layer(layer, ["num", "parcel"])
+
+    def test_ordered(self):
+        """Test NULL order values go last."""
+        ordered = self.snapshot.ordered("num")
+        self.assertEqual(ordered.xs.tolist(), [2, 3, 0, 4, 1])
+        self.assertEqual(ordered.attributes["num"][:4], (1, 2, 3, 4))
+        self.assertFalse(ordered.xs.flags.writeable)
+
+    def test_groups(self):
+        """Test features are grouped by parcel, NULL ids in one group."""
+        groups = self.snapshot.groups("parcel")
+        self.assertEqual([parcel for parcel, _group in groups],
+                         [None, "a", "b"])
+        self.assertEqual([group.xs.tolist() for _parcel, group in groups],
+                         [[3], [1, 4], [0, 2]])
+
+    def test_split_parcels(self):
+        """Test every parcel gets own points, order and no parts."""
+        values = {"snapshots": {"t_points": self.snapshot},
+                  "parcel_field": "parcel", "order_name": "num",
+                  "parts": [[1, 3]]}
+        jobs = split_parcels(values)
+        self.assertEqual([parcel for parcel, _values in jobs],
+                         [None, "a", "b"])
+        parcel, parcel_values = jobs[2]
+        self.assertEqual(parcel_values["parcel"], "b")
+        self.assertEqual(parcel_values["order"], [3, 1])
+        self.assertEqual(parcel_values["parts"], [])
+        self.assertIs(values["snapshots"]["t_points"], self.snapshot)
+        self.assertEqual(len(parcel_values["snapshots"]["t_points"]), 2)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(LayerSnapshotTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
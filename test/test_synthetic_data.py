@@ -0,0 +1,51 @@
+# coding=utf-8
+"""Synthetic datasets generator test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import unittest
+
+import numpy as np
+
+from .synthetic_data import parcel_points, surface_lines
+
+
+class SyntheticDataTest(unittest.TestCase):
+    """Test generated coordinates."""
+
+    def test_parcel_points(self):
+        """Test parts ranges and determinism by seed."""
+        xs, ys, ranges = parcel_points(10, seed=3, parts=3)
+        self.assertEqual(len(xs), 10)
+        self.assertEqual(ranges, [[1, 4], [5, 7], [8, 10]])
+        same_xs, same_ys, _ranges = parcel_points(10, seed=3, parts=3)
+        self.assertTrue(np.array_equal(xs, same_xs))
+        self.assertTrue(np.array_equal(ys, same_ys))
+        self.assertFalse(np.array_equal(xs, parcel_points(10, seed=4,
+                                                          parts=3)[0]))
+        with self.assertRaises(ValueError):
+            parcel_points(5, parts=2)
+
+    def test_surface_lines(self):
+        """Test surface geometries of every kind."""
+        roads = surface_lines("roads", 4, vertices=7)
+        self.assertEqual([len(road) for road in roads], [7] * 4)
+        parcels = surface_lines("parcels", 5)
+        self.assertEqual(len(parcels), 5)
+        for ring in parcels:
+            self.assertTrue(np.array_equal(ring[0], ring[-1]))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(SyntheticDataTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
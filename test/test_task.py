@@ -0,0 +1,100 @@
+# coding=utf-8
+"""Pipeline batch output test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import os
+import tempfile
+import unittest
+
+from qgis.core import (NULL, Qgis, QgsCoordinateReferenceSystem,
+                       QgsFeature, QgsField, QgsGeometry, QgsPointXY,
+                       QgsVectorLayer)
+from qgis.PyQt.QtCore import QVariant
+
+from utils.task import SHEET_NAME_CHARS, Pipeline
+from utils.values import build_values
+
+from .utilities import get_qgis_app
+QGIS_APP = get_qgis_app()
+
+
+def parcels_layer(parcels):
+    """Returns memory layer of turning points with parcel ids."""
+    layer = QgsVectorLayer("Point?crs=EPSG:32637", "points", "memory")
+    provider = layer.dataProvider()
+    provider.addAttributes([QgsField("num", QVariant.Int),
+                            QgsField("parcel", QVariant.String)])
+    layer.updateFields()
+    features = list()
+    for num, parcel in enumerate(parcels):
+        feature = QgsFeature(layer.fields())
+        feature.setGeometry(QgsGeometry.fromPointXY(
+            QgsPointXY(500000 + num, 6000000)))
+        feature.setAttributes([num + 1, parcel])
+        features.append(feature)
+    provider.addFeatures(features)
+    return layer
+
+
+class PipelineTest(unittest.TestCase):
+    """Test output files and sheets of batch mode."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.folder.name, "x.xls")
+        self.crs = QgsCoordinateReferenceSystem("EPSG:32637")
+
+    def tearDown(self):
+        """Runs after each test."""
+        self.folder.cleanup()
+
+    def pipeline(self, parcels, per_file):
+        values = build_values(self.crs, parcels_layer(parcels), "num", None,
+                              None, None, parcel_field="parcel")
+        return Pipeline(values, self.output, ("coords",), per_file)
+
+    def test_per_file(self):
+        """Test every group, NULL too, is saved to own file."""
+        pipeline = self.pipeline(["P1", NULL, "P1", NULL], True)
+        self.assertTrue(pipeline.run())
+        self.assertEqual(pipeline.errors, [])
+        self.assertEqual(sorted(os.listdir(self.folder.name)),
+                         ["x_NULL.xls", "x_P1.xls"])
+
+    def test_per_sheet(self):
+        """Test groups are saved to one file with unique sheets."""
+        long_id = "L" * 40
+        pipeline = self.pipeline([long_id + "1", long_id + "2", NULL],
+                                 False)
+        self.assertTrue(pipeline.run())
+        self.assertEqual(pipeline.errors, [])
+        self.assertEqual(os.listdir(self.folder.name), ["x.xls"])
+        names = pipeline.names
+        self.assertEqual(len(names), 3)
+        self.assertTrue(all(len(name) <= SHEET_NAME_CHARS
+                            for name in names))
+
+    def test_no_points(self):
+        """Test empty batch layer is a stage error."""
+        pipeline = self.pipeline([], True)
+        self.assertTrue(pipeline.run())
+        self.assertIn("coords", pipeline.errors)
+        self.assertIn(("Turning points", "No turning points",
+                       Qgis.Critical), pipeline.messages)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(PipelineTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
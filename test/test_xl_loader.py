@@ -0,0 +1,138 @@
+# coding=utf-8
+"""Excel sheets writer test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'shigaevaler@gmail.com'
+__date__ = '2022-08-09'
+__copyright__ = 'Copyright 2022, Valery Shigaev'
+
+import io
+import os
+import struct
+import tempfile
+import unittest
+import zipfile
+from xml.etree import ElementTree
+
+from utils.xl_loader import FLUSH_ROWS, XlHandler
+from utils.xlwt import CompoundDoc, Workbook
+
+
+def biff_records(data):
+    """Returns dict of stream position and (id, data) of BIFF records."""
+    records, pos = dict(), 0
+    while pos < len(data):
+        rec_id, size = struct.unpack_from("<2H", data, pos)
+        records[pos] = rec_id, data[pos + 4:pos + 4 + size]
+        pos += 4 + size
+    return records
+
+
+class XlHandlerTest(unittest.TestCase):
+    """Test streaming of rows into workbook sheets."""
+
+    def test_data_rows(self):
+        """Test columns are turned into rows."""
+        rows = list(XlHandler.data_rows({"Nm": [1, 2], "X": ["a"]}))
+        self.assertEqual(rows, [[1, "a"], [2, None]])
+
+    def test_write_rows(self):
+        """Test rows generator is flushed and saved."""
+        xl = XlHandler()
+        count = FLUSH_ROWS * 2 + 5
+        rows = ((num, num * 0.5, str(num)) for num in range(count))
+        self.assertTrue(xl.write_rows(rows, "rows"))
+        sheet = xl.xl.get_sheet(0)
+        self.assertEqual(sheet.get_rows(), {})
+        self.assertEqual(sheet.last_used_row, count - 1)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "rows.xls")
+            self.assertTrue(xl.save(filename))
+            self.assertGreater(os.path.getsize(filename), 0)
+
+    def test_missing_file(self):
+        """Test missing output file fails on save, not on creation."""
+        xl = XlHandler(None)
+        self.assertFalse(xl.xlsx)
+        self.assertTrue(xl.write_data({"Nm": [1]}, "sheet"))
+        self.assertFalse(xl.save(None))
+
+    def test_streamed_save(self):
+        """Test streamed save writes the same file as whole stream save."""
+        xl = XlHandler()
+        xl.write_rows(([num, str(num % 7)] for num in range(FLUSH_ROWS * 3)),
+                      "rows")
+        xl.write_data({"Nm": [1, 2], "X": ["a"]}, "data")
+        streamed, whole = io.BytesIO(), io.BytesIO()
+        xl.xl.save(streamed)
+        CompoundDoc.XlsDoc().save(whole, xl.xl.get_biff_data())
+        self.assertEqual(streamed.getvalue(), whole.getvalue())
+
+    def test_row_blocks(self):
+        """Test sorted rows in blocks and INDEX/DBCELL positions."""
+        xl = XlHandler()
+        xl.write_rows(([num, str(num)] for num in range(FLUSH_ROWS + 40)),
+                      "rows")
+        book = Workbook()
+        sheet = book.add_sheet("shuffled")
+        for rowx in (70, 3, 40, 0, 33, 100):
+            sheet.write(rowx, rowx % 3, rowx)
+        for workbook, count in ((xl.xl, FLUSH_ROWS + 40), (book, 6)):
+            records = biff_records(workbook.get_biff_data())
+            indexes = [data for rec_id, data in records.values()
+                       if rec_id == 0x020B]
+            self.assertEqual(len(indexes), 1)
+            index = indexes[0]
+            defcolwidth = struct.unpack_from("<L", index, 12)[0]
+            self.assertIn(defcolwidth, records)
+            rows = list()
+            for pos in struct.unpack_from("<%dL" % ((len(index) - 16) // 4),
+                                          index, 16):
+                rec_id, data = records[pos]
+                self.assertEqual(rec_id, 0x00D7)
+                first_row = pos - struct.unpack_from("<L", data)[0]
+                offsets = struct.unpack_from("<%dH" % ((len(data) - 4) // 2),
+                                             data, 4)
+                cell = first_row + 20
+                for num, offset in enumerate(offsets):
+                    row_id, row = records[first_row + 20 * num]
+                    self.assertEqual(row_id, 0x0208)
+                    rows.append(struct.unpack_from("<H", row)[0])
+                    cell += offset
+                    self.assertEqual(struct.unpack_from(
+                        "<H", records[cell][1])[0], rows[-1])
+                self.assertEqual(len({rowx // 32 for rowx in
+                                      rows[-len(offsets):]}), 1)
+            self.assertEqual(rows, sorted(rows))
+            self.assertEqual(len(rows), count)
+
+    def test_write_xlsx(self):
+        """Test xlsx workbook is selected by extension and streamed."""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "rows.xlsx")
+            xl = XlHandler(filename)
+            self.assertTrue(xl.write_data({"Nm": [1, 2], "X": ["a <b>"]},
+                                          "coords"))
+            self.assertTrue(xl.save(filename))
+            with zipfile.ZipFile(filename) as archive:
+                sheet = ElementTree.fromstring(
+                    archive.read("xl/worksheets/sheet1.xml"))
+                strings = archive.read("xl/sharedStrings.xml").decode()
+        ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/"
+                   "main"}
+        cells = [(cell.get("r"), cell.find("m:v", ns).text)
+                 for cell in sheet.iterfind(".//m:c", ns)]
+        self.assertEqual(cells, [("A1", "1"), ("B1", "0"), ("A2", "2")])
+        self.assertIn("a &lt;b&gt;", strings)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(XlHandlerTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
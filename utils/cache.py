@@ -0,0 +1,109 @@
+from qgis.core import QgsCoordinateReferenceSystem, QgsVectorLayer
+from threading import Lock
+from typing import Dict, Hashable, Sequence, Tuple
+from .transforms import crs_key
+
+
+class LayerCache:
+    """
+    This class keeps results computed from layers between runs. Entry key
+    contains id, data source and edit counter of every source layer. Edit
+    counter is increased by layer signals (data or crs changed), so edited
+    layers never hit an old entry, and entries of the layer are dropped.
+    Layer signals are emitted in main thread while runs read the cache in
+    task thread, so access is locked.
+
+    Args:
+        self.entries: dict of key and cached result
+        self.versions: dict of layer id and its edit counter
+        self.lock: lock of entries and versions
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[Tuple, any] = dict()
+        self.versions: Dict[str, int] = dict()
+        self.lock = Lock()
+
+    def key(self, layers: Sequence[QgsVectorLayer],
+            crs: QgsCoordinateReferenceSystem,
+            *extra: Hashable) -> Tuple:
+        """
+        This method returns entry key of layers state, layers are watched
+        from the first call.
+
+        :param layers: source layers
+        :type layers: Sequence[QgsVectorLayer]
+        :param crs: output crs
+        :type crs: QgsCoordinateReferenceSystem
+        :param extra: other parameters of result
+        :type extra: Hashable
+        :rtype: Tuple
+        """
+
+        key = list()
+        for layer in layers:
+            key.append((layer.id(), layer.source(), self.watch(layer)))
+        return (tuple(key), crs_key(crs)) + extra
+
+    def watch(self, layer: QgsVectorLayer) -> int:
+        """
+        This method connects layer signals once and returns edit counter of
+        layer.
+
+        :param layer: source layer
+        :type layer: QgsVectorLayer
+        :rtype: int
+        """
+
+        layer_id = layer.id()
+        with self.lock:
+            if layer_id in self.versions:
+                return self.versions[layer_id]
+            self.versions[layer_id] = 0
+        layer.dataChanged.connect(lambda: self.invalidate(layer_id))
+        layer.crsChanged.connect(lambda: self.invalidate(layer_id))
+        layer.willBeDeleted.connect(lambda: self.forget(layer_id))
+        return 0
+
+    def get(self, key: Tuple) -> any:
+        with self.lock:
+            return self.entries.get(key)
+
+    def put(self, key: Tuple, value: any) -> None:
+        with self.lock:
+            # key is outdated if layer was edited while result was computed
+            if all(self.versions.get(layer_id) == version
+                   for layer_id, _source, version in key[0]):
+                self.entries[key] = value
+
+    def invalidate(self, layer_id: str) -> None:
+        """
+        This method increases edit counter of layer and drops its entries.
+
+        :param layer_id: id of changed layer
+        :type layer_id: str
+        """
+
+        with self.lock:
+            if layer_id in self.versions:
+                self.versions[layer_id] += 1
+            self.drop(layer_id)
+
+    def forget(self, layer_id: str) -> None:
+        with self.lock:
+            self.versions.pop(layer_id, None)
+            self.drop(layer_id)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries = dict()
+
+    def drop(self, layer_id: str) -> None:
+        for key in [key for key in self.entries if layer_id in
+                    (layer_key[0] for layer_key in key[0])]:
+            del self.entries[key]
+
+
+# landmarks rows (names, azimuths, lengths, guides geometries) by
+# landmarks and benchmark layers state
+landmarks_cache = LayerCache()
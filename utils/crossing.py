@@ -0,0 +1,90 @@
+from qgis.core import (QgsCoordinateReferenceSystem,
+                       QgsCoordinateTransformContext, QgsFeatureRequest,
+                       QgsGeometry, QgsSpatialIndex, QgsVectorLayer,
+                       QgsVectorLayerFeatureSource)
+from typing import List, Tuple, Union
+from . import report
+from .snapshot import destination_request
+
+
+class SurfaceSource:
+    """
+    This class keeps what is needed to read a "surface" layer outside of
+    main thread. Layers must not be used from task thread, so sources are
+    created in main thread (see values.build_values) and only feature
+    source is read by CrossingEngine.
+
+    Args:
+        self.name: layer name
+        self.source: feature source, copy of layer data provider state
+        self.request: request of geometries in output crs
+        self.count: count of layer features
+    """
+
+    __slots__ = ("name", "source", "request", "count")
+
+    def __init__(self, layer: QgsVectorLayer,
+                 crs: QgsCoordinateReferenceSystem,
+                 context: Union[QgsCoordinateTransformContext,
+                                None] = None) -> None:
+        self.name = layer.name()
+        self.source = QgsVectorLayerFeatureSource(layer)
+        self.request: QgsFeatureRequest = destination_request(layer, crs,
+                                                              context)
+        self.request.setNoAttributes()
+        self.count = layer.featureCount()
+
+
+class CrossingEngine:
+    """
+    This class finds "surface" layers crossed by border segments. Every
+    layer is read once into a bulk loaded spatial index which also keeps
+    geometries, so each segment runs exact predicates only against bbox
+    candidates. Engine reads only feature sources, so it may be built in
+    task thread and shared by all parcels of a run.
+
+    Args:
+        self.layers: list of (layer name, spatial index with geometries)
+    """
+
+    def __init__(self, surface: List[SurfaceSource]) -> None:
+        self.layers: List[Tuple[str, QgsSpatialIndex]] = list()
+        for source in surface:
+            self.add_layer(source)
+
+    def add_layer(self, source: SurfaceSource) -> None:
+        """
+        This method bulk loads layer geometries in output crs into spatial
+        index, layer itself is not used.
+
+        :param source: surface layer source
+        :type source: SurfaceSource
+        """
+
+        index = QgsSpatialIndex(
+            source.source.getFeatures(source.request),
+            flags=QgsSpatialIndex.FlagStoreFeatureGeometries)
+        report.count("indexed_features", source.count)
+        self.layers.append((source.name, index))
+
+    def crossed_layers(self, line: QgsGeometry) -> List[str]:
+        """
+        This method returns names of layers which line crosses or
+        intersects. Every layer is reported once.
+
+        :param line: border segment
+        :type line: QgsGeometry
+        :rtype: List[str]
+        """
+
+        result = list()
+        bbox = line.boundingBox()
+        predicates = 0
+        for name, index in self.layers:
+            for fid in index.intersects(bbox):
+                predicates += 1
+                if line.intersects(index.geometry(fid)):
+                    result.append(name)
+                    break
+        report.count("predicates", predicates)
+        return result
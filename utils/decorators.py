@@ -1,10 +1,18 @@
+from functools import wraps
 from typing import Callable
+from . import report
+
+
+class HandlerCanceled(Exception):
+    """ Raised inside handlers when the run was canceled by user """
 
 
 def error_handler(sign: str) -> Callable:
     """
     Writes exceptions to logfile, returns True if no exceptions or False if
-    there are
+    there are. HandlerCanceled is not an error, it is raised to the caller
+    to stop the run. Calls are measured as stages of the active run report
+    (see report.RunReport).
 
     :param sign: logger text
     :type sign: str
@@ -12,15 +20,30 @@ def error_handler(sign: str) -> Callable:
     """
 
     def decorator(func: Callable):
+        @wraps(func)
         def wrapper(*args, **kwargs) -> bool:
-            try:
-                func(*args, **kwargs)
-                print(sign)
-                print("success")
-                return True
-            except Exception as e:
-                print(sign)
-                print(e)
-                return False
+            run_report = report.active()
+            if run_report is None:
+                return call(func, sign, args, kwargs)
+            with run_report.stage(sign) as record:
+                record.success = call(func, sign, args, kwargs, record)
+            return record.success
         return wrapper
     return decorator
+
+
+def call(func: Callable, sign: str, args: tuple, kwargs: dict,
+         record: report.StageRecord = None) -> bool:
+    try:
+        func(*args, **kwargs)
+        print(sign)
+        print("success")
+        return True
+    except HandlerCanceled:
+        raise
+    except Exception as e:
+        print(sign)
+        print(e)
+        if record is not None:
+            record.error = f"{type(e).__name__}: {e}"
+        return False
@@ -0,0 +1,198 @@
+import numpy as np
+from typing import List, Tuple
+
+# compass points of azimuth sectors starting from north, sector bounds are
+# 11.25 + 22.5 * n degrees
+LATIN_COMPASS = ["N", "NNE", "NE", "EEN", "E", "EES", "SE", "SSE", "S", "SSW",
+                 "SW", "WWS", "W", "WWN", "WN", "NNW"]
+COMPASS = {"English": LATIN_COMPASS,
+           "Deutsch": LATIN_COMPASS,
+           "Russian": ["C", "ССВ", "СВ", "ВСВ", "В", "ВЮВ", "ЮВ", "ЮЮВ", "Ю",
+                       "ЮЮЗ", "ЮЗ", "ЗЮЗ", "З", "ЗСЗ", "CЗ", "CCЗ"]}
+SECTORS = 11.25 + 22.5 * np.arange(16)
+# iterations limit of Vincenty formula, it converges in a few iterations
+# except nearly antipodal points
+GEODESIC_ITERATIONS = 200
+
+
+def segments(xs: np.ndarray,
+             ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates north based azimuths (0-360) and lengths of closed border
+    segments. Segment n goes from point n to point n + 1, the last one
+    goes back to the first point.
+
+    :param xs: x coordinates of ordered turning points
+    :type xs: np.ndarray
+    :param ys: y coordinates of ordered turning points
+    :type ys: np.ndarray
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    dx = np.roll(xs, -1) - xs
+    dy = np.roll(ys, -1) - ys
+    azimuth = 180 / np.pi * np.arctan2(dx, dy)
+    azimuth[azimuth < 0.0] += 360
+    return azimuth, np.hypot(dx, dy)
+
+
+def bearings(x0: float, y0: float, xs: np.ndarray,
+             ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates north based azimuths (0-360) and distances from one point
+    to many points, like degrees(azimuth()) and $length of lines from the
+    point.
+
+    :param x0: x coordinate of start point
+    :type x0: float
+    :param y0: y coordinate of start point
+    :type y0: float
+    :param xs: x coordinates of end points
+    :type xs: np.ndarray
+    :param ys: y coordinates of end points
+    :type ys: np.ndarray
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    dx = xs - x0
+    dy = ys - y0
+    azimuth = np.arctan2(dx, dy)
+    azimuth[azimuth < 0.0] += 2 * np.pi
+    return azimuth * 180 / np.pi, np.sqrt(dx * dx + dy * dy)
+
+
+def _vincenty_terms(lam: np.ndarray, sin_u1: np.ndarray, cos_u1: np.ndarray,
+                    sin_u2: np.ndarray, cos_u2: np.ndarray) -> Tuple[
+        np.ndarray, ...]:
+    sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+    sin_sigma = np.hypot(cos_u2 * sin_lam,
+                         cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+    cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+    sigma = np.arctan2(sin_sigma, cos_sigma)
+    # coincident points have sin_sigma == 0
+    sin_alpha = np.where(sin_sigma == 0, 0.0,
+                         cos_u1 * cos_u2 * sin_lam / sin_sigma)
+    cos2_alpha = 1 - sin_alpha * sin_alpha
+    # equatorial lines have cos2_alpha == 0
+    cos_2sm = np.where(cos2_alpha == 0, 0.0,
+                       cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha)
+    return (sin_lam, cos_lam, sin_sigma, cos_sigma, sigma, sin_alpha,
+            cos2_alpha, cos_2sm)
+
+
+def geodesic_inverse(lon1: np.ndarray, lat1: np.ndarray, lon2: np.ndarray,
+                     lat2: np.ndarray, a: float,
+                     f: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates forward azimuths (0-360) and ellipsoidal distances between
+    points by Vincenty inverse formula. All pairs are iterated together
+    until every pair converges, nearly antipodal pairs stop after
+    GEODESIC_ITERATIONS with the last approximation.
+
+    :param lon1: longitudes of start points in degrees
+    :type lon1: np.ndarray
+    :param lat1: latitudes of start points in degrees
+    :type lat1: np.ndarray
+    :param lon2: longitudes of end points in degrees
+    :type lon2: np.ndarray
+    :param lat2: latitudes of end points in degrees
+    :type lat2: np.ndarray
+    :param a: semi major axis of ellipsoid
+    :type a: float
+    :param f: flattening of ellipsoid
+    :type f: float
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    b = a * (1 - f)
+    big_l = np.radians(np.asarray(lon2, float) - np.asarray(lon1, float))
+    big_l = (big_l + np.pi) % (2 * np.pi) - np.pi
+    u1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+    u2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+    sin_u1, cos_u1 = np.sin(u1), np.cos(u1)
+    sin_u2, cos_u2 = np.sin(u2), np.cos(u2)
+    lam = big_l.copy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(GEODESIC_ITERATIONS):
+            (sin_lam, cos_lam, sin_sigma, cos_sigma, sigma, sin_alpha,
+             cos2_alpha, cos_2sm) = _vincenty_terms(lam, sin_u1, cos_u1,
+                                                    sin_u2, cos_u2)
+            c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            new = big_l + (1 - c) * f * sin_alpha * (
+                sigma + c * sin_sigma * (cos_2sm + c * cos_sigma *
+                                         (2 * cos_2sm * cos_2sm - 1)))
+            converged = np.all(np.abs(new - lam) <= 1e-12)
+            lam = new
+            if converged:
+                break
+        (sin_lam, cos_lam, sin_sigma, cos_sigma, sigma, sin_alpha,
+         cos2_alpha, cos_2sm) = _vincenty_terms(lam, sin_u1, cos_u1, sin_u2,
+                                                cos_u2)
+    u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+    big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq *
+                                              (320 - 175 * u_sq)))
+    big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    delta_sigma = big_b * sin_sigma * (cos_2sm + big_b / 4 * (
+        cos_sigma * (2 * cos_2sm * cos_2sm - 1) - big_b / 6 * cos_2sm *
+        (4 * sin_sigma * sin_sigma - 3) * (4 * cos_2sm * cos_2sm - 3)))
+    distance = b * big_a * (sigma - delta_sigma)
+    azimuth = np.degrees(np.arctan2(
+        cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam))
+    azimuth[azimuth < 0.0] += 360
+    return azimuth, distance
+
+
+def geodesic_segments(lons: np.ndarray, lats: np.ndarray, a: float,
+                      f: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates geodesic azimuths (0-360) and lengths of closed border
+    segments like segments does for planar coordinates.
+
+    :param lons: longitudes of ordered turning points in degrees
+    :type lons: np.ndarray
+    :param lats: latitudes of ordered turning points in degrees
+    :type lats: np.ndarray
+    :param a: semi major axis of ellipsoid
+    :type a: float
+    :param f: flattening of ellipsoid
+    :type f: float
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    return geodesic_inverse(lons, lats, np.roll(lons, -1),
+                            np.roll(lats, -1), a, f)
+
+
+def decimal_to_dms(deg: np.ndarray) -> List[str]:
+    """
+    Transforms decimals to deg-min-sec format.
+
+    :param deg: input decimals
+    :type deg: np.ndarray
+    :rtype: List[str]
+    """
+
+    integer = np.trunc(deg)
+    fraction = (deg - integer) * 60
+    minutes = np.trunc(fraction)
+    seconds = (fraction - minutes) * 60
+    return [f"{i}°{m}\'{round(s, 3)}\'\'" for i, m, s in
+            zip(integer.astype(np.int64).tolist(),
+                minutes.astype(np.int64).tolist(), seconds.tolist())]
+
+
+def az_to_str(az: np.ndarray, lang: str) -> List[str]:
+    """
+    Transforms azimuths to text version.
+
+    :param az: north based azimuths
+    :type az: np.ndarray
+    :param lang: output description language
+    :type lang: str
+    :rtype: List[str]
+    """
+
+    sector = np.searchsorted(SECTORS, az, side="left") % 16
+    sector[az >= SECTORS[-1]] = 0
+    names = COMPASS[lang]
+    return [names[idx] for idx in sector.tolist()]
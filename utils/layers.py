@@ -0,0 +1,108 @@
+from qgis.core import QgsCoordinateReferenceSystem, QgsFeature, QgsVectorLayer
+from qgis.PyQt.QtCore import QVariant
+from typing import Dict, List
+
+# memory provider names of field types
+FIELD_TYPES = {QVariant.String: "string", QVariant.Int: "integer",
+               QVariant.LongLong: "long", QVariant.Double: "double"}
+
+
+def memory_layer(geometry: str, name: str,
+                 crs: QgsCoordinateReferenceSystem,
+                 fields: Dict[str, QVariant.Type],
+                 features: List[QgsFeature]) -> QgsVectorLayer:
+    """
+    Creates output memory layer. Fields are declared in layer uri, features
+    must have final attributes and are inserted into provider in one batch,
+    so there is no edit buffer, undo stack or commit.
+
+    :param geometry: geometry type
+    :type geometry: str
+    :param name: layer name
+    :type name: str
+    :param crs: layer crs
+    :type crs: QgsCoordinateReferenceSystem
+    :param fields: dict of field name and its type
+    :type fields: Dict[str, QVariant.Type]
+    :param features: features with attributes in fields order
+    :type features: List[QgsFeature]
+    :rtype: QgsVectorLayer
+    """
+
+    uri = "&".join([geometry] + [f"field={field}:{FIELD_TYPES[kind]}"
+                                 for field, kind in fields.items()])
+    layer = QgsVectorLayer(uri.replace("&", "?", 1), name, "memory")
+    layer.setCrs(crs)
+    added, _features = layer.dataProvider().addFeatures(features)
+    if not added:
+        raise ValueError(f"Features are not added to {name} layer")
+    layer.updateExtents()
+    return layer
+
+
+class LayerOutput:
+    """
+    This class collects features of output layers of a run. Handlers add
+    features by layer name, every layer is built once when run is
+    finished, so multi part borders and batch parcels share one border
+    layer and one guides layer.
+
+    Args:
+        self.fields: dict of layer name and its fields
+        self.features: dict of layer name and its features
+    """
+
+    def __init__(self) -> None:
+        self.fields: Dict[str, Dict[str, QVariant.Type]] = dict()
+        self.features: Dict[str, List[QgsFeature]] = dict()
+
+    def add(self, name: str, fields: Dict[str, QVariant.Type],
+            features: List[QgsFeature]) -> None:
+        """
+        This method adds features to layer, fields are set by first call.
+
+        :param name: layer name
+        :type name: str
+        :param fields: dict of field name and its type
+        :type fields: Dict[str, QVariant.Type]
+        :param features: features with attributes in fields order
+        :type features: List[QgsFeature]
+        """
+
+        self.fields.setdefault(name, fields)
+        self.features.setdefault(name, list()).extend(features)
+
+    def put(self, name: str, fields: Dict[str, QVariant.Type],
+            features: List[QgsFeature]) -> None:
+        """
+        This method replaces features of layer. It is used for layers
+        which are the same for every parcel of a run.
+
+        :param name: layer name
+        :type name: str
+        :param fields: dict of field name and its type
+        :type fields: Dict[str, QVariant.Type]
+        :param features: features with attributes in fields order
+        :type features: List[QgsFeature]
+        """
+
+        self.fields[name] = fields
+        self.features[name] = list(features)
+
+    def build(self, crs: QgsCoordinateReferenceSystem
+              ) -> List[QgsVectorLayer]:
+        """
+        This method creates collected layers.
+
+        :param crs: layers crs
+        :type crs: QgsCoordinateReferenceSystem
+        :rtype: List[QgsVectorLayer]
+        """
+
+        return [memory_layer("Linestring", name, crs, self.fields[name],
+                             features)
+                for name, features in self.features.items()]
+
+    def clear(self) -> None:
+        self.fields = dict()
+        self.features = dict()
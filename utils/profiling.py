@@ -0,0 +1,114 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+import cProfile
+import io
+import os
+import pstats
+
+# hidden switches of run profiling, environment variable wins
+PROFILE_KEY = "ArchTabs/profile"
+PROFILE_ENV = "ARCHTABS_PROFILE"
+# number of functions in log summaries
+SUMMARY_ROWS = 15
+
+
+def profiling_enabled() -> bool:
+    """
+    Returns True if runs must be profiled: ARCHTABS_PROFILE environment
+    variable is "1"/"true"/"yes" or ArchTabs/profile setting is true.
+
+    :rtype: bool
+    """
+
+    env = os.environ.get(PROFILE_ENV)
+    if env is not None:
+        return env.strip().lower() in ("1", "true", "yes")
+    from qgis.PyQt.QtCore import QSettings
+    return QSettings().value(PROFILE_KEY, False, type=bool)
+
+
+class RunProfiler:
+    """
+    This class profiles parts of a run with cProfile. Run is split between
+    main thread (reading of input layers) and task thread (pipeline), every
+    part gets its own profile and their stats are merged on save.
+
+    Args:
+        self.profiles: finished profiles of run parts
+    """
+
+    def __init__(self) -> None:
+        self.profiles: List[cProfile.Profile] = list()
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """ This method profiles code of with block in current thread """
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.profiles.append(profile)
+
+    def stats(self) -> pstats.Stats:
+        stats = pstats.Stats(self.profiles[0], stream=io.StringIO())
+        for profile in self.profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def save(self, filename: str) -> None:
+        """
+        This method writes merged stats in pstats format (.prof), it is
+        read by pstats or snakeviz.
+
+        :param filename: profile file
+        :type filename: str
+        """
+
+        self.stats().dump_stats(filename)
+
+    def summary(self, sort: str = "cumulative",
+                rows: int = SUMMARY_ROWS) -> List[str]:
+        """
+        This method returns lines of the most expensive functions.
+
+        :param sort: pstats sort key ("cumulative" or "tottime")
+        :type sort: str
+        :param rows: number of functions
+        :type rows: int
+        :rtype: List[str]
+        """
+
+        stats = self.stats()
+        stats.stream = io.StringIO()
+        stats.sort_stats(sort).print_stats(rows)
+        return [line for line in stats.stream.getvalue().splitlines()
+                if line.strip()]
+
+    def finish(self, filename: str, tag: str = "ArchTabs") -> None:
+        """
+        This method saves profile and writes hot paths (by cumulative and
+        own time) into QGIS log panel.
+
+        :param filename: profile file
+        :type filename: str
+        :param tag: log panel tab
+        :type tag: str
+        """
+
+        from qgis.core import Qgis, QgsMessageLog
+        if not self.profiles:
+            return
+        try:
+            self.save(filename)
+        except OSError as e:
+            QgsMessageLog.logMessage(f"Profile is not saved: {e}", tag,
+                                     Qgis.Warning)
+            return
+        QgsMessageLog.logMessage(f"Profile saved to {filename}", tag,
+                                 Qgis.Info)
+        for sort in ("cumulative", "tottime"):
+            QgsMessageLog.logMessage("\n".join(self.summary(sort)), tag,
+                                     Qgis.Info)
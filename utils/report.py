@@ -0,0 +1,212 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Union
+import json
+import threading
+import time
+import tracemalloc
+
+# active report of every thread, runs of background tasks do not mix
+_local = threading.local()
+
+
+class StageRecord:
+    """
+    This class keeps measures of one call of a stage.
+
+    Args:
+        self.name: stage sign (error_handler sign)
+        self.wall: wall time, s
+        self.cpu: cpu time of the thread, s
+        self.peak: peak of traced memory above stage start, bytes (None if
+        memory is not traced)
+        self.counters: dict of counter name and its value
+        self.success: False if stage raised exception
+        self.error: text of exception
+    """
+
+    __slots__ = ("name", "wall", "cpu", "peak", "counters", "success",
+                 "error")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak: Union[int, None] = None
+        self.counters: Dict[str, int] = dict()
+        self.success = True
+        self.error = ""
+
+    def as_dict(self) -> Dict[str, any]:
+        return {"name": self.name, "wall": self.wall, "cpu": self.cpu,
+                "peak": self.peak, "counters": dict(self.counters),
+                "success": self.success, "error": self.error}
+
+
+class RunReport:
+    """
+    This class collects measures of stages (calls wrapped by
+    error_handler) of a run. Counters are added with count function by
+    code which runs inside a stage. Memory is traced with tracemalloc only
+    if trace_memory is set, because tracing slows allocations down.
+
+    Args:
+        self.trace_memory: record peak memory of stages
+        self.stages: records of finished stages in order of finish
+        self.stack: records of running stages
+        self.peaks: peaks of traced memory of running stages, bytes
+        self.started: wall time of activation
+        self.wall: wall time of the run, s
+        self.tracing: True if tracemalloc was started by the report
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.stages: List[StageRecord] = list()
+        self.stack: List[StageRecord] = list()
+        self.peaks: List[int] = list()
+        self.started = 0.0
+        self.wall = 0.0
+        self.tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageRecord]:
+        """
+        This method measures code of with block as stage.
+
+        :param name: stage sign
+        :type name: str
+        :rtype: Iterator[StageRecord]
+        """
+
+        record = StageRecord(name)
+        traced = self.trace_memory and tracemalloc.is_tracing()
+        if traced:
+            current, peak = tracemalloc.get_traced_memory()
+            if self.peaks:
+                self.peaks[-1] = max(self.peaks[-1], peak)
+            # python < 3.9 has no reset_peak, peak of the run is used
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            self.peaks.append(current)
+        self.stack.append(record)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield record
+        finally:
+            record.wall = time.perf_counter() - wall
+            record.cpu = time.thread_time() - cpu
+            self.stack.pop()
+            if traced:
+                _current, peak = tracemalloc.get_traced_memory()
+                seen = max(self.peaks.pop(), peak)
+                record.peak = seen - current
+                if self.peaks:
+                    self.peaks[-1] = max(self.peaks[-1], seen)
+            self.stages.append(record)
+
+    def count(self, name: str, value: int = 1) -> None:
+        if self.stack:
+            counters = self.stack[-1].counters
+            counters[name] = counters.get(name, 0) + value
+
+    def activate(self) -> None:
+        """ This method makes report active in current thread """
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.tracing = True
+        self.started = time.perf_counter()
+        _local.report = self
+
+    def deactivate(self) -> None:
+        self.wall = time.perf_counter() - self.started
+        if self.tracing:
+            tracemalloc.stop()
+            self.tracing = False
+        if getattr(_local, "report", None) is self:
+            _local.report = None
+
+    def totals(self) -> Dict[str, Dict[str, any]]:
+        """
+        This method sums records of stages by name.
+
+        :rtype: Dict[str, Dict[str, any]]
+        """
+
+        totals: Dict[str, Dict[str, any]] = dict()
+        for record in self.stages:
+            total = totals.setdefault(record.name, {
+                "calls": 0, "wall": 0.0, "cpu": 0.0, "peak": None,
+                "failures": 0, "counters": dict()})
+            total["calls"] += 1
+            total["wall"] += record.wall
+            total["cpu"] += record.cpu
+            total["failures"] += not record.success
+            if record.peak is not None:
+                total["peak"] = max(total["peak"] or 0, record.peak)
+            for name, value in record.counters.items():
+                total["counters"][name] = total["counters"].get(name,
+                                                                0) + value
+        return totals
+
+    def as_dict(self) -> Dict[str, any]:
+        return {"wall": self.wall, "totals": self.totals(),
+                "stages": [record.as_dict() for record in self.stages]}
+
+    def save(self, filename: str) -> None:
+        """
+        This method writes report as JSON.
+
+        :param filename: report file
+        :type filename: str
+        """
+
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(self.as_dict(), file, indent=1, ensure_ascii=False)
+
+    def lines(self) -> List[str]:
+        """
+        This method returns summary of stages, one line per stage name.
+
+        :rtype: List[str]
+        """
+
+        lines = [f"Run {self.wall:.3f} s"]
+        for name, total in self.totals().items():
+            text = f"{name}: {total['calls']} calls, wall " \
+                   f"{total['wall']:.3f} s, cpu {total['cpu']:.3f} s"
+            if total["peak"] is not None:
+                text += f", peak {total['peak'] / 2 ** 20:.1f} MiB"
+            if total["failures"]:
+                text += f", {total['failures']} failed"
+            text += "".join(f", {counter} {value}" for counter, value in
+                            total["counters"].items())
+            lines.append(text)
+        return lines
+
+    def log(self, tag: str = "ArchTabs") -> None:
+        """ This method writes summary into QGIS log panel """
+
+        from qgis.core import Qgis, QgsMessageLog
+        for line in self.lines():
+            QgsMessageLog.logMessage(line, tag, Qgis.Info)
+
+
+def active() -> Union[RunReport, None]:
+    return getattr(_local, "report", None)
+
+
+def count(name: str, value: int = 1) -> None:
+    """
+    Adds value to counter of running stage of active report, does nothing
+    if there is no active report.
+
+    :param name: counter name
+    :type name: str
+    :param value: counter increment
+    :type value: int
+    """
+
+    report = active()
+    if report is not None:
+        report.count(name, value)
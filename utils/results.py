@@ -0,0 +1,182 @@
+import numpy as np
+from typing import Callable, Dict, Iterable, Iterator, List, Union
+from . import kernels
+
+# rows are formatted by chunks of CHUNK_ROWS rows on export
+CHUNK_ROWS = 1000
+
+
+def dms(column: np.ndarray) -> List[str]:
+    return kernels.decimal_to_dms(column)
+
+
+def rounded(digits: int) -> Callable[[np.ndarray], List[float]]:
+    """
+    Returns formatter which rounds numbers like python round.
+
+    :param digits: number of decimal digits
+    :type digits: int
+    :rtype: Callable[[np.ndarray], List[float]]
+    """
+
+    return lambda column: [round(value, digits) for value in column.tolist()]
+
+
+class ResultTable:
+    """
+    This class keeps handler results by columns. Numeric columns are numpy
+    arrays, they grow with preallocation and are formatted (e.g. to
+    deg-min-sec text) only when rows are exported, other columns are
+    lists. Columns are exported in declaration order.
+
+    Args:
+        self.names: names of columns
+        self.kinds: dict of column name and its dtype (None for list column)
+        self.formats: dict of column name and its text formatter
+        self.columns: dict of column name and its values
+        self.size: number of values of every numeric column
+    """
+
+    __slots__ = ("names", "kinds", "formats", "columns", "size")
+
+    def __init__(self, columns: Dict[str, Union[type, None]],
+                 formats: Dict[str, Callable[[np.ndarray], List[any]]] = None
+                 ) -> None:
+        self.names = list(columns)
+        self.kinds = dict(columns)
+        self.formats = formats or dict()
+        self.columns: Dict[str, Union[np.ndarray, List[any]]] = dict()
+        self.size: Dict[str, int] = dict()
+        self.clear()
+
+    def __len__(self) -> int:
+        return max((self.length(name) for name in self.names), default=0)
+
+    def clear(self) -> None:
+        """ This method drops all values """
+
+        for name, kind in self.kinds.items():
+            self.columns[name] = list() if kind is None else \
+                np.empty(0, dtype=kind)
+            self.size[name] = 0
+
+    def length(self, name: str) -> int:
+        if self.kinds[name] is None:
+            return len(self.columns[name])
+        return self.size[name]
+
+    def reserve(self, count: int) -> None:
+        """
+        This method preallocates numeric columns for count more rows.
+
+        :param count: number of rows
+        :type count: int
+        """
+
+        for name, kind in self.kinds.items():
+            if kind is not None:
+                self.grow(name, self.size[name] + count)
+
+    def grow(self, name: str, capacity: int) -> None:
+        column = self.columns[name]
+        if len(column) >= capacity:
+            return
+        new = np.empty(max(capacity, 2 * len(column)), dtype=column.dtype)
+        new[:self.size[name]] = column[:self.size[name]]
+        self.columns[name] = new
+
+    def extend(self, name: str, values: Iterable[any]) -> None:
+        """
+        This method appends values to column.
+
+        :param name: column name
+        :type name: str
+        :param values: values of column
+        :type values: Iterable[any]
+        """
+
+        if self.kinds[name] is None:
+            self.columns[name].extend(values)
+            return
+        values = np.asarray(values if isinstance(values, np.ndarray)
+                            else list(values), dtype=self.kinds[name])
+        size = self.size[name]
+        self.grow(name, size + len(values))
+        self.columns[name][size:size + len(values)] = values
+        self.size[name] = size + len(values)
+
+    def column(self, name: str) -> Union[np.ndarray, List[any]]:
+        """
+        This method returns values of column, numeric columns are read only
+        views without copy.
+
+        :param name: column name
+        :type name: str
+        :rtype: Union[np.ndarray, List[any]]
+        """
+
+        if self.kinds[name] is None:
+            return self.columns[name]
+        view = self.columns[name][:self.size[name]]
+        view.flags.writeable = False
+        return view
+
+    def cells(self, name: str, start: int, stop: int,
+              numeric: bool) -> List[any]:
+        column = self.column(name)[start:stop]
+        if self.kinds[name] is None:
+            return list(column)
+        if name in self.formats and not (numeric and
+                                         self.formats[name] is dms):
+            return self.formats[name](column)
+        return column.tolist()
+
+    def rows(self, numeric: bool = False) -> Iterator[List[any]]:
+        """
+        This method yields rows for export. Cells of short columns are
+        None. Deg-min-sec columns are exported as decimal degrees if
+        numeric is True.
+
+        :param numeric: export angles as numbers
+        :type numeric: bool
+        :rtype: Iterator[List[any]]
+        """
+
+        count = len(self)
+        for start in range(0, count, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, count)
+            chunk = [self.cells(name, start, stop, numeric)
+                     for name in self.names]
+            for num in range(stop - start):
+                yield [cells[num] if num < len(cells) else None
+                       for cells in chunk]
+
+    def as_dict(self, numeric: bool = False) -> Dict[str, List[any]]:
+        """
+        This method returns dict of formatted columns.
+
+        :param numeric: export angles as numbers
+        :type numeric: bool
+        :rtype: Dict[str, List[any]]
+        """
+
+        return {name: self.cells(name, 0, self.length(name), numeric)
+                for name in self.names}
+
+
+def landmarks_table() -> ResultTable:
+    return ResultTable({"Nm": None, "Az": np.float64, "Len": np.int64},
+                       {"Az": dms})
+
+
+def coord_table() -> ResultTable:
+    return ResultTable({"Nm": None, "X": np.float64, "Y": np.float64,
+                        "X1": np.float64, "Y1": np.float64},
+                       {"X": dms, "Y": dms, "X1": rounded(3),
+                        "Y1": rounded(3)})
+
+
+def bound_table() -> ResultTable:
+    return ResultTable({"From": np.int64, "To": np.int64, "Desc": None,
+                        "Az": np.float64, "Len": np.float64},
+                       {"Az": dms, "Len": rounded(2)})
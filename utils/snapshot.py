@@ -0,0 +1,146 @@
+from qgis.core import (NULL, QgsCoordinateReferenceSystem,
+                       QgsCoordinateTransformContext, QgsFeatureRequest,
+                       QgsProject, QgsVectorLayer)
+from typing import Dict, List, Sequence, Tuple, Union
+import numpy as np
+
+
+class LayerSnapshot:
+    """
+    This class keeps an immutable copy of point layer data. Layer is read
+    once with a request restricted to the needed attributes, handlers use
+    coordinates arrays and attribute tuples instead of new layer scans.
+
+    Args:
+        self.xs: read only array of x coordinates in features order
+        self.ys: read only array of y coordinates in features order
+        self.attributes: dict of field name and tuple of its values
+    """
+
+    __slots__ = ("xs", "ys", "attributes")
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray,
+                 attributes: Dict[str, Tuple[any, ...]]) -> None:
+        xs.flags.writeable = False
+        ys.flags.writeable = False
+        self.xs = xs
+        self.ys = ys
+        self.attributes = attributes
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    @classmethod
+    def from_layer(cls, layer: QgsVectorLayer,
+                   fields: Sequence[str] = (),
+                   crs: Union[QgsCoordinateReferenceSystem, None] = None,
+                   context: Union[QgsCoordinateTransformContext,
+                                  None] = None) -> "LayerSnapshot":
+        """
+        This method fetches layer features once. Coordinates are
+        transformed to crs by the request, layer is not changed.
+
+        :param layer: point layer
+        :type layer: QgsVectorLayer
+        :param fields: names of fields to keep
+        :type fields: Sequence[str]
+        :param crs: crs of coordinates, layer crs if None
+        :type crs: QgsCoordinateReferenceSystem
+        :param context: transform context, project context if None
+        :type context: QgsCoordinateTransformContext
+        :rtype: LayerSnapshot
+        """
+
+        fields = [field for field in dict.fromkeys(fields) if field]
+        request = destination_request(layer, crs, context)
+        request.setSubsetOfAttributes(fields, layer.fields())
+        xs, ys = list(), list()
+        columns: Dict[str, List[any]] = {field: list() for field in fields}
+        for feature in layer.getFeatures(request):
+            point = feature.geometry().asPoint()
+            xs.append(point.x())
+            ys.append(point.y())
+            for field in fields:
+                columns[field].append(feature[field])
+        return cls(np.array(xs, dtype=float), np.array(ys, dtype=float),
+                   {field: tuple(column) for field, column in
+                    columns.items()})
+
+    def subset(self, indices: Sequence[int]) -> "LayerSnapshot":
+        """
+        This method returns snapshot of selected features.
+
+        :param indices: features indices
+        :type indices: Sequence[int]
+        :rtype: LayerSnapshot
+        """
+
+        indices = np.asarray(indices, dtype=int)
+        return LayerSnapshot(self.xs[indices], self.ys[indices],
+                             {field: tuple(column[idx] for idx in indices)
+                              for field, column in self.attributes.items()})
+
+    def ordered(self, field: str) -> "LayerSnapshot":
+        """
+        This method returns snapshot sorted by field ascending, NULL values
+        go last like in QgsFeatureRequest.OrderByClause.
+
+        :param field: order field
+        :type field: str
+        :rtype: LayerSnapshot
+        """
+
+        column = self.attributes[field]
+        return self.subset(sorted(range(len(column)),
+                                  key=lambda idx: self.order_key(
+                                      column[idx])))
+
+    def groups(self, field: str) -> List[Tuple[any, "LayerSnapshot"]]:
+        """
+        This method splits snapshot by field values.
+
+        :param field: group field
+        :type field: str
+        :rtype: List[Tuple[any, LayerSnapshot]]
+        """
+
+        groups: Dict[any, List[int]] = dict()
+        for idx, value in enumerate(self.attributes[field]):
+            if self.order_key(value)[0]:
+                value = None
+            groups.setdefault(value, list()).append(idx)
+        return [(value, self.subset(groups[value])) for value in
+                sorted(groups, key=str)]
+
+    @staticmethod
+    def order_key(value: any) -> Tuple[bool, any]:
+        null = value is None or value == NULL
+        return null, 0 if null else value
+
+
+def destination_request(layer: QgsVectorLayer,
+                        crs: Union[QgsCoordinateReferenceSystem, None],
+                        context: Union[QgsCoordinateTransformContext,
+                                       None] = None) -> QgsFeatureRequest:
+    """
+    Returns request which transforms layer geometries to crs. Layers
+    without valid crs are read as is, their coordinates are taken in crs.
+    Project transform context is used if context is None, it is read in
+    main thread only.
+
+    :param layer: source layer
+    :type layer: QgsVectorLayer
+    :param crs: destination crs
+    :type crs: QgsCoordinateReferenceSystem
+    :param context: transform context
+    :type context: QgsCoordinateTransformContext
+    :rtype: QgsFeatureRequest
+    """
+
+    request = QgsFeatureRequest()
+    if crs is not None and crs.isValid() and layer.crs().isValid() \
+            and layer.crs() != crs:
+        if context is None:
+            context = QgsProject.instance().transformContext()
+        request.setDestinationCrs(crs, context)
+    return request
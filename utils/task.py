@@ -0,0 +1,361 @@
+from qgis.core import QgsTask, QgsVectorLayer, Qgis
+from qgis.PyQt.QtCore import QCoreApplication
+from typing import Callable, Dict, List, Sequence, Set, Tuple, Union
+import os.path
+import re
+import tempfile
+from .data_handler import DataHandler, HandlerCanceled
+from .xl_loader import XlHandler
+from .layers import LayerOutput
+from .report import RunReport
+from .profiling import RunProfiler
+from .values import split_parcels
+
+# error key, handler, result attribute, sheet name, message title,
+# success text, failure text, share of the whole run progress
+STAGES = (
+    ("landmarks", "landmarks_handler", "landmarks_data", "landmarks",
+     "Landmarks", "Landmarks data recorded", "Please check landmarks", 10),
+    ("coords", "coord_handler", "coord_data", "coordinates",
+     "Turning points", "Coordinates data recorded", "Please check points",
+     20),
+    ("borders", "borders_handler", "bound_data", "description",
+     "Turning points", "Borders data recorded", "Please check points", 60),
+)
+# share of the whole run progress for saving of the output file
+SAVE_SHARE = 10
+# xlsx strings are written inline from this number of turning points,
+# shared strings table keeps every unique string in memory
+INLINE_POINTS = 100000
+# parcel label of turning points without parcel id in batch mode
+NULL_PARCEL = "NULL"
+# length limit of Excel sheet names
+SHEET_NAME_CHARS = 31
+
+
+class Pipeline:
+    """
+    This class runs DataHandler stages and writes their results with
+    XlHandler. It does not touch the interface, so it is shared by plugin
+    dialog, background task and processing algorithms.
+
+    In batch mode (values["parcel_field"] is set) turning points are
+    grouped by parcel id field and every parcel is handled independently.
+    Results are written in one workbook per parcel or in one workbook with
+    sheets per parcel (landmarks sheet is written once). Points without
+    parcel id make NULL_PARCEL group, file and sheet names of parcels are
+    made unique.
+
+    Args:
+        self.values: dict of interface data
+        self.output_file: output excel file
+        self.stages: keys of stages to run (see STAGES)
+        self.per_file: write one workbook per parcel in batch mode
+        self.numeric: write angles as decimal degrees instead of
+        deg-min-sec text
+        self.inline_strings: write xlsx strings inside cells, None selects
+        inline strings for INLINE_POINTS turning points or more
+        self.report_file: JSON file of run report, memory of stages is
+        traced if it is set
+        self.log_report: write run report summary into QGIS log panel
+        self.report: timings and counters of stages of the run
+        self.messages: list of message records (title, text, level)
+        self.errors: list of failed stages
+        self.output: features of output layers of all parcels
+        self.layers: list of layers created during run, one layer of every
+        kind
+        self.names: used file and sheet names in lower case
+    """
+
+    def __init__(self, values: Dict[str, any], output_file: str,
+                 stages: Sequence[str] = ("landmarks", "coords",
+                                          "borders"),
+                 per_file: bool = False, numeric: bool = False,
+                 report_file: Union[str, None] = None,
+                 log_report: bool = False,
+                 inline_strings: Union[bool, None] = None) -> None:
+        self.values = values
+        self.output_file = output_file
+        self.stages = stages
+        self.per_file = per_file
+        self.numeric = numeric
+        self.inline_strings = inline_strings
+        self.report_file = report_file
+        self.log_report = log_report
+        self.report = RunReport(trace_memory=bool(report_file))
+        self.messages: List[Tuple[str, str, Qgis.MessageLevel]] = list()
+        self.errors: List[str] = list()
+        self.output = LayerOutput()
+        self.layers: List[QgsVectorLayer] = list()
+        self.names: Set[str] = set()
+
+    def batch(self) -> bool:
+        return bool(self.values.get("parcel_field"))
+
+    def jobs(self) -> List[Tuple[any, Dict[str, any]]]:
+        """
+        This method returns (parcel label, dict of interface data) pairs.
+        Label is None if batch mode is off, NULL_PARCEL for points without
+        parcel id. Batch mode without turning points has no jobs.
+
+        :rtype: List[Tuple[any, Dict[str, any]]]
+        """
+
+        if self.batch():
+            return [(NULL_PARCEL if parcel is None else parcel, values)
+                    for parcel, values in split_parcels(self.values)]
+        return [(None, self.values)]
+
+    def inline(self) -> bool:
+        """
+        This method returns True if xlsx strings must be written inline.
+
+        :rtype: bool
+        """
+
+        if self.inline_strings is not None:
+            return self.inline_strings
+        snapshot = self.values["snapshots"].get("t_points")
+        return snapshot is not None and len(snapshot) >= INLINE_POINTS
+
+    def run(self, progress: Union[Callable[[float], None], None] = None,
+            canceled: Union[Callable[[], bool], None] = None) -> bool:
+        """
+        This method runs selected stages and saves output files. It returns
+        False if run was canceled. Stages are measured by run report.
+
+        :param progress: callback which receives run progress (0-100)
+        :type progress: Callable[[float], None]
+        :param canceled: callback which returns True if run was canceled
+        :type canceled: Callable[[], bool]
+        :rtype: bool
+        """
+
+        self.report = RunReport(trace_memory=bool(self.report_file))
+        self.report.activate()
+        try:
+            return self.run_jobs(progress, canceled)
+        finally:
+            self.report.deactivate()
+            self.write_report()
+
+    def run_jobs(self, progress: Union[Callable[[float], None], None],
+                 canceled: Union[Callable[[], bool], None]) -> bool:
+        self.names = set()
+        jobs = self.jobs()
+        stages = [stage for stage in STAGES if stage[0] in self.stages]
+        per_file = self.per_file and self.batch()
+        if not jobs:
+            # batch mode without turning points: point stages fail and
+            # landmarks are written to output file
+            for key, _handler, _data, _sheet, title, _success, _failure, \
+                    _share in stages:
+                if key != "landmarks":
+                    self.errors.append(key)
+                    self.messages.append((title, "No turning points",
+                                          Qgis.Critical))
+            stages = [stage for stage in stages if stage[0] == "landmarks"]
+            jobs = [(None, self.values)]
+            per_file = False
+        total = len(jobs) * (sum(stage[-1] for stage in stages) + SAVE_SHARE)
+        base = 0.0
+        inline = self.inline()
+        xl = XlHandler(self.output_file, inline, self.numeric)
+        # surface index depends only on surface layers and crs, they are
+        # the same for all parcels, so layers are indexed once per run
+        crossing = None
+        for num, (parcel, values) in enumerate(jobs):
+            dh = DataHandler()
+            dh.crossing = crossing
+            dh.output = self.output
+            dh.canceled = canceled
+            for (key, handler, data, sheet, title, success, failure,
+                 share) in stages:
+                if key == "landmarks" and num and not per_file:
+                    base += share
+                    continue
+                if progress is not None:
+                    dh.progress = lambda value, start=base, width=share: \
+                        progress(100 * (start + width * value) / total)
+                if parcel is not None:
+                    title = f"{title} ({parcel})"
+                    if not per_file and key != "landmarks":
+                        sheet = self.sheet_name(sheet, parcel)
+                try:
+                    done = getattr(dh, handler)(values)
+                except HandlerCanceled:
+                    return False
+                if done:
+                    if xl.write_data(getattr(dh, data), sheet):
+                        self.messages.append((title, success, Qgis.Success))
+                    else:
+                        self.messages.append((title, failure, Qgis.Warning))
+                else:
+                    self.errors.append(key)
+                    self.messages.append((title, failure, Qgis.Critical))
+                if canceled is not None and canceled():
+                    return False
+                base += share
+            crossing = dh.crossing
+            dh.clear_data()
+            if per_file:
+                self.save(xl, self.parcel_file(parcel), f"File ({parcel})")
+                xl = XlHandler(self.output_file, inline, self.numeric)
+            base += SAVE_SHARE
+        if not per_file:
+            self.save(xl, self.output_file, "File")
+        self.layers = self.output.build(self.values["crs"])
+        self.output.clear()
+        if progress is not None:
+            progress(100)
+        return True
+
+    def write_report(self) -> None:
+        """ This method writes run report into file and log panel """
+
+        if self.report_file:
+            try:
+                self.report.save(self.report_file)
+            except OSError as e:
+                self.messages.append(("Run report", str(e), Qgis.Warning))
+        if self.log_report:
+            self.report.log()
+
+    def save(self, xl: XlHandler, filename: str, title: str) -> None:
+        """
+        This method saves workbook and records result message.
+
+        :param xl: workbook handler
+        :type xl: XlHandler
+        :param filename: output file
+        :type filename: str
+        :param title: message title
+        :type title: str
+        """
+
+        if xl.save(filename):
+            self.messages.append((title, "File recorded", Qgis.Success))
+        else:
+            self.errors.append("file")
+            self.messages.append((title, "File not recorded",
+                                  Qgis.Critical))
+
+    def parcel_file(self, parcel: any) -> str:
+        """
+        This method returns unique output file of parcel in per file batch
+        mode.
+
+        :param parcel: parcel id
+        :type parcel: any
+        :rtype: str
+        """
+
+        if not self.output_file:
+            return self.output_file
+        root, ext = os.path.splitext(self.output_file)
+        name = re.sub(r'[^\w.-]', '_', str(parcel))
+        return self.unique_name(f"{root}_{name}", suffix=ext)
+
+    def sheet_name(self, sheet: str, parcel: any) -> str:
+        """
+        This method returns unique sheet name of parcel in per sheet batch
+        mode. Excel sheet names are limited to 31 chars without []:*?/\\.
+
+        :param sheet: stage sheet name
+        :type sheet: str
+        :param parcel: parcel id
+        :type parcel: any
+        :rtype: str
+        """
+
+        return self.unique_name(re.sub(r'[\[\]:*?/\\]', '_',
+                                       f"{sheet}_{parcel}"),
+                                SHEET_NAME_CHARS)
+
+    def unique_name(self, name: str, limit: Union[int, None] = None,
+                    suffix: str = "") -> str:
+        """
+        This method cuts name to limit and adds "~2", "~3"... before suffix
+        until name is not used. Names are compared in lower case like
+        Excel sheet names and Windows file names.
+
+        :param name: name
+        :type name: str
+        :param limit: max length of name
+        :type limit: int
+        :param suffix: part after name (file extension)
+        :type suffix: str
+        :rtype: str
+        """
+
+        result = name[:limit] + suffix
+        num = 1
+        while result.lower() in self.names:
+            num += 1
+            mark = f"~{num}"
+            end = None if limit is None else limit - len(mark)
+            result = name[:end] + mark + suffix
+        self.names.add(result.lower())
+        return result
+
+
+class ArchTabsTask(QgsTask):
+    """
+    This class runs Pipeline in background. Message bar records and
+    created layers are collected and must be handled in main thread when
+    task finished. If report is set, run report is written next to output
+    file (<output>.report.json) and into QGIS log panel. If profiler is
+    given, pipeline is profiled and profile is saved next to output file
+    (<output>.prof) even if run was canceled. Without output file these
+    files are written to temp folder (archtabs.report.json,
+    archtabs.prof), missing output file is reported by the pipeline.
+
+    Args:
+        self.pipeline: pipeline of the run
+        self.profiler: profiler of the run or None
+    """
+
+    def __init__(self, values: Dict[str, any], output_file: str,
+                 per_file: bool = False, report: bool = False,
+                 profiler: Union[RunProfiler, None] = None) -> None:
+        super().__init__("ArchTabs", QgsTask.CanCancel)
+        self.profiler = profiler
+        report_file = None
+        if report:
+            report_file = f"{self.output_root(output_file)}.report.json"
+        self.pipeline = Pipeline(values, output_file, per_file=per_file,
+                                 report_file=report_file, log_report=report)
+
+    def run(self) -> bool:
+        if self.profiler is None:
+            return self.run_pipeline()
+        try:
+            with self.profiler.profile():
+                return self.run_pipeline()
+        finally:
+            root = self.output_root(self.pipeline.output_file)
+            self.profiler.finish(f"{root}.prof")
+
+    @staticmethod
+    def output_root(output_file: Union[str, None]) -> str:
+        """
+        This method returns output file path without extension, path in
+        temp folder if output file is not selected.
+
+        :param output_file: output excel file
+        :type output_file: str
+        :rtype: str
+        """
+
+        if not output_file:
+            return os.path.join(tempfile.gettempdir(), "archtabs")
+        return os.path.splitext(output_file)[0]
+
+    def run_pipeline(self) -> bool:
+        if not self.pipeline.run(self.setProgress, self.isCanceled):
+            self.pipeline.layers = list()
+            return False
+        main_thread = QCoreApplication.instance().thread()
+        for layer in self.pipeline.layers:
+            layer.moveToThread(main_thread)
+        return True
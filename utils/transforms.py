@@ -0,0 +1,108 @@
+from qgis.core import (QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+                       QgsCoordinateTransformContext, QgsEllipsoidUtils,
+                       QgsGeometry, QgsPointXY)
+from threading import Lock
+from typing import Dict, Tuple
+import numpy as np
+
+_cache: Dict[Tuple[str, str, str], QgsCoordinateTransform] = dict()
+_lock = Lock()
+
+
+def crs_key(crs: QgsCoordinateReferenceSystem) -> str:
+    return crs.authid() or crs.toWkt()
+
+
+def context_key(context: QgsCoordinateTransformContext) -> str:
+    """ Returns key of coordinate operations selected in context """
+
+    return repr(sorted(context.coordinateOperations().items()))
+
+
+def get_transform(source: QgsCoordinateReferenceSystem,
+                  dest: QgsCoordinateReferenceSystem,
+                  context: QgsCoordinateTransformContext
+                  ) -> QgsCoordinateTransform:
+    """
+    Returns transform between crs. Transforms are cached by (source, dest)
+    crs and coordinate operations of context, caller gets its own cheap
+    copy of cached object. Context is taken from project in main thread
+    (see values.build_values), project is not used in task thread.
+
+    :param source: source crs
+    :type source: QgsCoordinateReferenceSystem
+    :param dest: destination crs
+    :type dest: QgsCoordinateReferenceSystem
+    :param context: transform context of project
+    :type context: QgsCoordinateTransformContext
+    :rtype: QgsCoordinateTransform
+    """
+
+    key = (crs_key(source), crs_key(dest), context_key(context))
+    with _lock:
+        if key not in _cache:
+            _cache[key] = QgsCoordinateTransform(source, dest, context)
+        return QgsCoordinateTransform(_cache[key])
+
+
+def transform_points(xs: np.ndarray, ys: np.ndarray,
+                     source: QgsCoordinateReferenceSystem,
+                     dest: QgsCoordinateReferenceSystem,
+                     context: QgsCoordinateTransformContext
+                     ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Transforms all points with one call as a multipoint geometry.
+
+    :param xs: x coordinates
+    :type xs: np.ndarray
+    :param ys: y coordinates
+    :type ys: np.ndarray
+    :param source: source crs
+    :type source: QgsCoordinateReferenceSystem
+    :param dest: destination crs
+    :type dest: QgsCoordinateReferenceSystem
+    :param context: transform context of project
+    :type context: QgsCoordinateTransformContext
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    if source == dest or not len(xs):
+        return xs.copy(), ys.copy()
+    geometry = QgsGeometry.fromMultiPointXY(
+        [QgsPointXY(x, y) for x, y in zip(xs.tolist(), ys.tolist())])
+    geometry.transform(get_transform(source, dest, context))
+    points = geometry.asMultiPoint()
+    return (np.fromiter((point.x() for point in points), float, len(points)),
+            np.fromiter((point.y() for point in points), float, len(points)))
+
+
+def geographic_points(xs: np.ndarray, ys: np.ndarray,
+                      crs: QgsCoordinateReferenceSystem,
+                      context: QgsCoordinateTransformContext
+                      ) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    Transforms points to geographic crs of crs datum and returns their
+    longitudes, latitudes and ellipsoid (semi major axis and flattening).
+    WGS 84 is used if crs has no geographic crs or ellipsoid.
+
+    :param xs: x coordinates
+    :type xs: np.ndarray
+    :param ys: y coordinates
+    :type ys: np.ndarray
+    :param crs: crs of points
+    :type crs: QgsCoordinateReferenceSystem
+    :param context: transform context of project
+    :type context: QgsCoordinateTransformContext
+    :rtype: Tuple[np.ndarray, np.ndarray, float, float]
+    """
+
+    geographic = QgsCoordinateReferenceSystem(crs.geographicCrsAuthId())
+    ellipsoid = QgsEllipsoidUtils.ellipsoidParameters(
+        crs.ellipsoidAcronym())
+    if not geographic.isValid() or not ellipsoid.valid:
+        geographic = QgsCoordinateReferenceSystem("EPSG:4326")
+        ellipsoid = QgsEllipsoidUtils.ellipsoidParameters("EPSG:7030")
+    a = ellipsoid.semiMajor
+    f = (a - ellipsoid.semiMinor) / a
+    lons, lats = transform_points(xs, ys, crs, geographic, context)
+    return lons, lats, a, f
@@ -0,0 +1,131 @@
+from qgis.core import (QgsCoordinateReferenceSystem,
+                       QgsCoordinateTransformContext, QgsProject,
+                       QgsVectorLayer)
+from typing import Dict, List, Tuple, Union
+
+LANGUAGES = ["Deutsch", "English", "Russian"]
+
+
+def build_values(crs: QgsCoordinateReferenceSystem,
+                 t_points: Union[QgsVectorLayer, None],
+                 order_name: Union[str, None],
+                 landmarks: Union[QgsVectorLayer, None],
+                 names_field: Union[str, None],
+                 benchmark: Union[QgsVectorLayer, None],
+                 lang: str = "Russian",
+                 parts: List[List[int]] = None,
+                 surface: List[QgsVectorLayer] = None,
+                 parcel_field: Union[str, None] = None,
+                 geodesic: bool = False,
+                 context: Union[QgsCoordinateTransformContext, None] = None
+                 ) -> Dict[str, any]:
+    """
+    Collects dict of interface data which is used by DataHandler. It is
+    shared by plugin dialog and processing algorithms. Every input point
+    layer is read here once with coordinates in output crs, handlers use
+    its snapshot (values["snapshots"]) and never change input layers.
+    Surface layers are kept as feature sources (values["surface"]) and
+    project transform context is copied (values["context"]), so it must be
+    called in main thread before the run task starts. Landmarks rows are
+    looked up in landmarks_cache first, landmarks and benchmark layers are
+    not read if they are cached (values["landmarks_rows"]).
+
+    :param crs: output crs
+    :type crs: QgsCoordinateReferenceSystem
+    :param t_points: turning points layer
+    :type t_points: QgsVectorLayer
+    :param order_name: turning points order field
+    :type order_name: str
+    :param landmarks: landmarks layer
+    :type landmarks: QgsVectorLayer
+    :param names_field: landmarks names field
+    :type names_field: str
+    :param benchmark: benchmark layer
+    :type benchmark: QgsVectorLayer
+    :param lang: output description language, one of LANGUAGES
+    :type lang: str
+    :param parts: ranges of points of border parts
+    :type parts: List[List[int]]
+    :param surface: layers which border may cross
+    :type surface: List[QgsVectorLayer]
+    :param parcel_field: parcel id field of turning points for batch mode
+    :type parcel_field: str
+    :param geodesic: calculate border lengths and azimuths on ellipsoid
+    :type geodesic: bool
+    :param context: transform context, project context if None
+    :type context: QgsCoordinateTransformContext
+    :rtype: Dict[str, any]
+    """
+
+    # imported here, numpy is not loaded with plugin
+    from .cache import landmarks_cache
+    from .crossing import SurfaceSource
+    from .snapshot import LayerSnapshot
+    from .transforms import context_key
+    if context is None:
+        context = QgsProject.instance().transformContext()
+    values = {"crs": crs, "context": context, "lang": lang,
+              "parts": parts or list(), "snapshots": dict(),
+              "geodesic": geodesic}
+    if t_points is not None and order_name:
+        snapshot = LayerSnapshot.from_layer(t_points,
+                                            [order_name, parcel_field], crs,
+                                            context)
+        values["t_points"] = t_points
+        values["snapshots"]["t_points"] = snapshot
+        values["order"] = list(snapshot.attributes[order_name])
+        values["order_name"] = order_name
+        if parcel_field:
+            values["parcel_field"] = parcel_field
+    rows = None
+    if landmarks is not None and names_field and benchmark is not None:
+        key = landmarks_cache.key((landmarks, benchmark), crs, names_field,
+                                  context_key(context))
+        values["landmarks_key"] = key
+        rows = landmarks_cache.get(key)
+        if rows is not None:
+            values["landmarks_rows"] = rows
+            values["names"] = list(rows[0])
+    if landmarks is not None and names_field:
+        values["landmarks"] = landmarks
+        if rows is None:
+            snapshot = LayerSnapshot.from_layer(landmarks, [names_field],
+                                                crs, context)
+            values["snapshots"]["landmarks"] = snapshot
+            values["names"] = list(snapshot.attributes[names_field])
+    if benchmark is not None:
+        values["benchmark"] = benchmark
+        if rows is None:
+            values["snapshots"]["benchmark"] = LayerSnapshot.from_layer(
+                benchmark, crs=crs, context=context)
+    if surface:
+        values["surface"] = [SurfaceSource(layer, crs, context)
+                             for layer in surface]
+    return values
+
+
+def split_parcels(values: Dict[str, any]) -> List[Tuple[any,
+                                                        Dict[str, any]]]:
+    """
+    Splits dict of interface data by parcel id field of turning points
+    layer. Every parcel gets its own turning points snapshot, order list
+    and parcel id (values["parcel"]), manual ranges of border parts are
+    not used in batch mode.
+
+    :param values: dict of interface data
+    :type values: Dict[str, any]
+    :rtype: List[Tuple[any, Dict[str, any]]]
+    """
+
+    result = list()
+    snapshot = values["snapshots"]["t_points"]
+    for parcel, parcel_snapshot in snapshot.groups(values["parcel_field"]):
+        parcel_values = dict(values)
+        parcel_values["snapshots"] = dict(values["snapshots"])
+        parcel_values["snapshots"]["t_points"] = parcel_snapshot
+        parcel_values["order"] = list(
+            parcel_snapshot.attributes[values["order_name"]])
+        parcel_values["parts"] = list()
+        parcel_values["parcel"] = None if parcel is None else str(parcel)
+        result.append((parcel, parcel_values))
+    return result
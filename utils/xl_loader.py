@@ -1,34 +1,96 @@
-from typing import Dict, List
+from itertools import zip_longest
+from typing import Dict, Iterable, Iterator, List, Sequence, Union
 from .logger import log
+from . import report
 from .decorators import error_handler
-from .xlwt import Workbook
+from .results import ResultTable
+
+# rows are written to sheet temp file every FLUSH_ROWS rows, multiple of
+# 32 (rows of BIFF Row Block) keeps blocks whole
+FLUSH_ROWS = 1024
 
 
 class XlHandler:
     """
-    This class allows to write data into xl sheets
+    This class allows to write data into xl sheets. Rows are written in
+    order and flushed to temp files of sheets, so only last FLUSH_ROWS rows
+    of every sheet are kept in memory. Workbook format is selected by output
+    file extension: .xlsx files are written by xlsx_writer, other files by
+    xlwt (Excel 97-2003, 65536 rows and 256 columns per sheet). Missing
+    filename selects xlwt, save() reports the error later.
 
     Args:
+        self.xlsx: True if workbook is xlsx
+        self.numeric: write angles of result tables as decimal degrees
         self.xl: excel workbook
     """
 
-    def __init__(self):
-        self.xl = Workbook()
+    def __init__(self, filename: str = "", inline_strings: bool = False,
+                 numeric: bool = False):
+        # writers are imported here, plugin load does not pay for them
+        self.xlsx = (filename or "").lower().endswith(".xlsx")
+        self.numeric = numeric
+        if self.xlsx:
+            from .xlsx_writer import Workbook
+            self.xl = Workbook(inline_strings)
+        else:
+            from .xlwt import Workbook
+            self.xl = Workbook()
 
     @error_handler("Excel write sheets")
-    def write_data(self, data: Dict[str, List[any]], sheet: str, ) -> None:
+    def write_data(self, data: Union[ResultTable, Dict[str, List[any]]],
+                   sheet: str, ) -> None:
+        if isinstance(data, ResultTable):
+            self.stream_rows(data.rows(self.numeric), sheet)
+        else:
+            self.stream_rows(self.data_rows(data), sheet)
+
+    @error_handler("Excel write rows")
+    def write_rows(self, rows: Iterable[Sequence[any]], sheet: str) -> None:
+        """
+        This method writes rows into new sheet. Rows may be generator, it is
+        consumed once.
+
+        :param rows: rows of cells values, None cells are skipped
+        :type rows: Iterable[Sequence[any]]
+        :param sheet: sheet name
+        :type sheet: str
+        """
+
+        self.stream_rows(rows, sheet)
+
+    def stream_rows(self, rows: Iterable[Sequence[any]], sheet: str) -> None:
         sheet = self.xl.add_sheet(sheet)
-        row_counter = 0
-        for key, value in data.items():
-            for num in range(len(value)):
-                row = sheet.row(num)
-                column = row_counter
-                row.write(column, value[num])
-            row_counter += 1
+        if self.xlsx:
+            for cells in rows:
+                sheet.write_row(cells)
+            report.count("rows", sheet.rows)
+            return
+        num = -1
+        for num, cells in enumerate(rows):
+            row = sheet.row(num)
+            for column, value in enumerate(cells):
+                if value is not None:
+                    row.write(column, value)
+            if num % FLUSH_ROWS == FLUSH_ROWS - 1:
+                sheet.flush_row_data()
+        if num % FLUSH_ROWS != FLUSH_ROWS - 1:
+            sheet.flush_row_data()
+        report.count("rows", num + 1)
 
-    @error_handler("Excel save file")
-    def save(self, filename: str) -> None:
-        self.xl.save(filename)
+    @staticmethod
+    def data_rows(data: Dict[str, List[any]]) -> Iterator[List[any]]:
+        """
+        This method turns dict of columns into rows, cells of short columns
+        are None.
 
+        :param data: dict of column name and its values
+        :type data: Dict[str, List[any]]
+        :rtype: Iterator[List[any]]
+        """
 
+        return (list(cells) for cells in zip_longest(*data.values()))
 
+    @error_handler("Excel save file")
+    def save(self, filename: str) -> None:
+        self.xl.save(filename)
@@ -0,0 +1,279 @@
+""" Streaming writer of Office Open XML workbooks (.xlsx) """
+
+from numbers import Integral, Number
+from typing import Dict, IO, List, Sequence
+from xml.sax.saxutils import escape, quoteattr
+import math
+import re
+import shutil
+import tempfile
+import zipfile
+
+MAX_ROWS = 1048576
+MAX_COLS = 16384
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/" \
+         "relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+CONTENT_TYPES = "application/vnd.openxmlformats-officedocument."
+SHEET_TYPE = CONTENT_TYPES + "spreadsheetml.worksheet+xml"
+WORKBOOK_TYPE = CONTENT_TYPES + "spreadsheetml.sheet.main+xml"
+STYLES_TYPE = CONTENT_TYPES + "spreadsheetml.styles+xml"
+STRINGS_TYPE = CONTENT_TYPES + "spreadsheetml.sharedStrings+xml"
+
+STYLES = (
+    f'{XML_HEADER}<styleSheet xmlns="{MAIN_NS}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font>'
+    '</fonts><fills count="2"><fill><patternFill patternType="none"/>'
+    '</fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/>'
+    '</border></borders><cellStyleXfs count="1"><xf numFmtId="0" '
+    'fontId="0" fillId="0" borderId="0"/></cellStyleXfs><cellXfs count="1">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '</cellXfs><cellStyles count="1"><cellStyle name="Normal" xfId="0" '
+    'builtinId="0"/></cellStyles></styleSheet>')
+
+# chars which are not allowed in xml 1.0
+ILLEGAL_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+ILLEGAL_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+def column_name(column: int) -> str:
+    """
+    Converts zero based column index to its letters (0 -> A, 26 -> AA).
+
+    :param column: column index
+    :type column: int
+    :rtype: str
+    """
+
+    name = ""
+    column += 1
+    while column:
+        column, rest = divmod(column - 1, 26)
+        name = chr(65 + rest) + name
+    return name
+
+
+def text_element(text: str) -> str:
+    text = escape(ILLEGAL_CHARS.sub("", text))
+    if text[:1].isspace() or text[-1:].isspace():
+        return f'<t xml:space="preserve">{text}</t>'
+    return f"<t>{text}</t>"
+
+
+class Worksheet:
+    """
+    This class writes sheet rows into temp file as xml. Rows are written in
+    order and are not kept in memory.
+
+    Args:
+        self.name: sheet name
+        self.parent: workbook of sheet
+        self.rows: number of written rows
+        self.tempfile: temp file with sheetData content
+    """
+
+    def __init__(self, name: str, parent: "Workbook") -> None:
+        self.name = name
+        self.parent = parent
+        self.rows = 0
+        self.tempfile: IO[bytes] = tempfile.TemporaryFile()
+
+    def write_row(self, cells: Sequence[any]) -> None:
+        """
+        This method writes next row of sheet.
+
+        :param cells: cells values, None cells are skipped
+        :type cells: Sequence[any]
+        """
+
+        if self.rows >= MAX_ROWS:
+            raise ValueError(f"Sheet {self.name!r} is limited to "
+                             f"{MAX_ROWS} rows")
+        self.rows += 1
+        num = self.rows
+        parts = [f'<row r="{num}">']
+        for column, value in enumerate(cells):
+            if value is None:
+                continue
+            if column >= MAX_COLS:
+                raise ValueError(f"Sheet {self.name!r} is limited to "
+                                 f"{MAX_COLS} columns")
+            ref = f"{self.parent.column_name(column)}{num}"
+            if isinstance(value, bool):
+                parts.append(f'<c r="{ref}" t="b"><v>{int(value)}</v></c>')
+            elif isinstance(value, Number) and math.isfinite(value):
+                # numpy scalars are converted, their repr is not a number
+                value = int(value) if isinstance(value, Integral) \
+                    else float(value)
+                parts.append(f'<c r="{ref}"><v>{value!r}</v></c>')
+            elif self.parent.inline_strings:
+                parts.append(f'<c r="{ref}" t="inlineStr"><is>'
+                             f'{text_element(str(value))}</is></c>')
+            else:
+                parts.append(f'<c r="{ref}" t="s"><v>'
+                             f'{self.parent.string_index(str(value))}'
+                             f'</v></c>')
+        parts.append("</row>")
+        self.tempfile.write("".join(parts).encode("utf-8"))
+
+    def save(self, archive: zipfile.ZipFile, path: str) -> None:
+        """
+        This method copies sheet xml into archive.
+
+        :param archive: xlsx archive
+        :type archive: zipfile.ZipFile
+        :param path: sheet path in archive
+        :type path: str
+        """
+
+        size = self.tempfile.seek(0, 2)
+        self.tempfile.seek(0)
+        with archive.open(path, "w", force_zip64=size > 2 ** 30) as stream:
+            stream.write(f'{XML_HEADER}<worksheet xmlns="{MAIN_NS}">'
+                         f'<sheetData>'.encode("utf-8"))
+            shutil.copyfileobj(self.tempfile, stream)
+            stream.write(b"</sheetData></worksheet>")
+        self.tempfile.seek(0, 2)
+
+
+class Workbook:
+    """
+    This class writes xlsx workbook. Its interface follows xlwt Workbook:
+    sheets are added with add_sheet and file is written with save. Sheets
+    rows are streamed into temp files. Strings are shared by default like
+    in files saved by Excel, shared strings table keeps every unique string
+    in memory until save. Inline strings are written with rows, so memory
+    does not grow with rows number.
+
+    Args:
+        self.inline_strings: write strings inside cells
+        self.sheets: list of workbook sheets
+        self.strings: dict of shared string and its index
+        self.strings_count: number of shared strings cells
+        self.columns: cache of column letters
+    """
+
+    def __init__(self, inline_strings: bool = False) -> None:
+        self.inline_strings = inline_strings
+        self.sheets: List[Worksheet] = list()
+        self.strings: Dict[str, int] = dict()
+        self.strings_count = 0
+        self.columns: List[str] = list()
+
+    def add_sheet(self, name: str) -> Worksheet:
+        """
+        This method adds new sheet.
+
+        :param name: sheet name
+        :type name: str
+        :rtype: Worksheet
+        """
+
+        if not name or len(name) > 31 or ILLEGAL_SHEET_CHARS.search(name):
+            raise ValueError(f"Invalid worksheet name {name!r}")
+        if name.lower() in (sheet.name.lower() for sheet in self.sheets):
+            raise ValueError(f"Duplicate worksheet name {name!r}")
+        sheet = Worksheet(name, self)
+        self.sheets.append(sheet)
+        return sheet
+
+    def get_sheet(self, index: int) -> Worksheet:
+        return self.sheets[index]
+
+    def column_name(self, column: int) -> str:
+        while len(self.columns) <= column:
+            self.columns.append(column_name(len(self.columns)))
+        return self.columns[column]
+
+    def string_index(self, text: str) -> int:
+        self.strings_count += 1
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def save(self, filename: str) -> None:
+        """
+        This method writes workbook file.
+
+        :param filename: output file
+        :type filename: str
+        """
+
+        if not self.sheets:
+            raise ValueError("Workbook must contain at least one worksheet")
+        with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("[Content_Types].xml", self.content_types())
+            archive.writestr("_rels/.rels", self.package_rels())
+            archive.writestr("xl/workbook.xml", self.workbook())
+            archive.writestr("xl/_rels/workbook.xml.rels",
+                             self.workbook_rels())
+            archive.writestr("xl/styles.xml", STYLES)
+            for num, sheet in enumerate(self.sheets, 1):
+                sheet.save(archive, f"xl/worksheets/sheet{num}.xml")
+            if self.strings:
+                with archive.open("xl/sharedStrings.xml", "w") as stream:
+                    self.shared_strings(stream)
+
+    def content_types(self) -> str:
+        parts = [
+            f'{XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/'
+            f'package/2006/content-types">'
+            f'<Default Extension="rels" ContentType="application/'
+            f'vnd.openxmlformats-package.relationships+xml"/>'
+            f'<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" '
+            f'ContentType="{WORKBOOK_TYPE}"/>'
+            f'<Override PartName="/xl/styles.xml" '
+            f'ContentType="{STYLES_TYPE}"/>']
+        for num in range(1, len(self.sheets) + 1):
+            parts.append(f'<Override PartName="/xl/worksheets/sheet{num}.xml"'
+                         f' ContentType="{SHEET_TYPE}"/>')
+        if self.strings:
+            parts.append(f'<Override PartName="/xl/sharedStrings.xml" '
+                         f'ContentType="{STRINGS_TYPE}"/>')
+        parts.append("</Types>")
+        return "".join(parts)
+
+    @staticmethod
+    def package_rels() -> str:
+        return (f'{XML_HEADER}<Relationships xmlns="{PKG_REL_NS}">'
+                f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" '
+                f'Target="xl/workbook.xml"/></Relationships>')
+
+    def workbook(self) -> str:
+        sheets = "".join(f'<sheet name={quoteattr(sheet.name)} '
+                         f'sheetId="{num}" r:id="rId{num}"/>'
+                         for num, sheet in enumerate(self.sheets, 1))
+        return (f'{XML_HEADER}<workbook xmlns="{MAIN_NS}" '
+                f'xmlns:r="{REL_NS}"><sheets>{sheets}</sheets></workbook>')
+
+    def workbook_rels(self) -> str:
+        count = len(self.sheets)
+        parts = [f'{XML_HEADER}<Relationships xmlns="{PKG_REL_NS}">']
+        for num in range(1, count + 1):
+            parts.append(f'<Relationship Id="rId{num}" '
+                         f'Type="{REL_NS}/worksheet" '
+                         f'Target="worksheets/sheet{num}.xml"/>')
+        parts.append(f'<Relationship Id="rId{count + 1}" '
+                     f'Type="{REL_NS}/styles" Target="styles.xml"/>')
+        if self.strings:
+            parts.append(f'<Relationship Id="rId{count + 2}" '
+                         f'Type="{REL_NS}/sharedStrings" '
+                         f'Target="sharedStrings.xml"/>')
+        parts.append("</Relationships>")
+        return "".join(parts)
+
+    def shared_strings(self, stream: IO[bytes]) -> None:
+        stream.write(f'{XML_HEADER}<sst xmlns="{MAIN_NS}" '
+                     f'count="{self.strings_count}" '
+                     f'uniqueCount="{len(self.strings)}">'.encode("utf-8"))
+        # dict keeps insertion order, which is the order of indices
+        for text in self.strings:
+            stream.write(f"<si>{text_element(text)}</si>".encode("utf-8"))
+        stream.write(b"</sst>")
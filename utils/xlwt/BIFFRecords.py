@@ -1233,6 +1233,56 @@ class DimensionsRecord(BiffRecord):
             0x00)
 
 
+class IndexRecord(BiffRecord):
+    """
+    Record INDEX, BIFF8:
+
+    Offset  Size    Contents
+    0       4       Not used
+    4       4       Index to first used row (rf, 0-based)
+    8       4       Index to first row of unused tail of sheet (rl, last
+                    used row + 1, 0-based)
+    12      4       Absolute stream position of the DEFCOLWIDTH record
+    16      4*nm    Array of nm absolute stream positions to the DBCELL
+                    record of each Row Block
+
+    INDEX can not be continued, positions past MAX_BLOCKS are dropped
+    (65536 rows make 2048 blocks of 32 rows, so only sheets with partial
+    blocks lose positions). Readers scan the rest of Row Blocks.
+    """
+    _REC_ID = 0x020B
+    MAX_BLOCKS = (0x2020 - 16) // 4
+
+    def __init__(self, first_used_row, last_used_row, defcolwidth_pos, dbcell_positions):
+        if first_used_row > last_used_row:
+            # Special case: empty worksheet
+            first_used_row = 0
+            last_used_row = -1
+        dbcell_positions = dbcell_positions[:self.MAX_BLOCKS]
+        self._rec_data = pack('<4L%dL' % len(dbcell_positions),
+            0x00, first_used_row, last_used_row + 1, defcolwidth_pos,
+            *dbcell_positions)
+
+
+class DbCellRecord(BiffRecord):
+    """
+    Record DBCELL, BIFF8:
+
+    Offset  Size    Contents
+    0       4       Relative offset to first ROW record in the Row Block
+                    (from start of this DBCELL record)
+    4       2*nc    Array of nc offsets to the first cell record of every
+                    row of the Row Block. First offset is relative to the
+                    start of the second ROW record of the block, others
+                    are relative to the first cell record of previous row
+    """
+    _REC_ID = 0x00D7
+
+    def __init__(self, row_offset, cell_offsets):
+        self._rec_data = pack('<L%dH' % len(cell_offsets),
+            row_offset, *cell_offsets)
+
+
 class Window2Record(BiffRecord):
     """
     Record WINDOW2, BIFF8:
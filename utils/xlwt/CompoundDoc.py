@@ -248,9 +248,14 @@ class XlsDoc:
                                         
 
     def save(self, file_name_or_filelike_obj, stream):
+        self.save_chunks(file_name_or_filelike_obj, [stream], len(stream))
+
+    def save_chunks(self, file_name_or_filelike_obj, chunks, length):
+        # Workbook stream is written chunk by chunk, its length is known
+        # beforehand, so SAT and directory are built before writing.
         # 1. Align stream on 0x1000 boundary (and therefore on sector boundary)
-        padding = b'\x00' * (0x1000 - (len(stream) % 0x1000))
-        self.book_stream_len = len(stream) + len(padding)
+        padding = b'\x00' * (0x1000 - (length % 0x1000))
+        self.book_stream_len = length + len(padding)
 
         self._build_directory()
         self._build_sat()
@@ -267,14 +272,20 @@ class XlsDoc:
         # This is said to be alleviated by using "w+b" mode instead of "wb".
         # One xlwt user has reported anomalous results at much smaller sizes,
         # The fallback is to write the stream in 4 MB chunks.
-        try:
-            f.write(stream)
-        except IOError as e:
-            if e.errno != 22: # "Invalid argument" i.e. 'stream' is too big
-                raise # some other problem
-            chunk_size = 4 * 1024 * 1024
-            for offset in xrange(0, len(stream), chunk_size):
-                f.write(buffer(stream, offset, chunk_size))
+        written = 0
+        for chunk in chunks:
+            try:
+                f.write(chunk)
+            except IOError as e:
+                if e.errno != 22: # "Invalid argument" i.e. 'chunk' is too big
+                    raise # some other problem
+                chunk_size = 4 * 1024 * 1024
+                view = memoryview(chunk)
+                for offset in xrange(0, len(chunk), chunk_size):
+                    f.write(view[offset:offset + chunk_size])
+            written += len(chunk)
+        if written != length:
+            raise Exception("Workbook stream is %d bytes, %d expected" % (written, length))
         f.write(padding)
         f.write(self.packed_MSAT_2nd)
         f.write(self.packed_SAT)
@@ -5,12 +5,19 @@ from . import BIFFRecords
 from . import Style
 from .Cell import StrCell, BlankCell, NumberCell, FormulaCell, MulBlankCell, BooleanCell, ErrorCell, \
     _get_cells_biff_data_mul
-from . import ExcelFormula
 import datetime as dt
+import sys
 from .Formatting import Font
 from .compat import basestring, xrange, int_types, iteritems
 
 
+def _is_formula(label):
+    # ExcelFormula (and its antlr parser) is imported on first use of
+    # xlwt.Formula, until then no value can be a formula.
+    module = sys.modules.get(__name__.rpartition('.')[0] + '.ExcelFormula')
+    return module is not None and isinstance(label, module.Formula)
+
+
 class Row(object):
     __slots__ = [# private variables
                  "__idx",
@@ -245,7 +252,7 @@ class Row(object):
             self.insert_cell(col, NumberCell(self.__idx, col, style_index, date_number))
         elif label is None:
             self.insert_cell(col, BlankCell(self.__idx, col, style_index))
-        elif isinstance(label, ExcelFormula.Formula):
+        elif _is_formula(label):
             self.__parent_wb.add_sheet_reference(label)
             self.insert_cell(col, FormulaCell(self.__idx, col, style_index, label))
         elif isinstance(label, (list, tuple)):
@@ -578,6 +578,14 @@ class Workbook(object):
     def __useselfs_rec(self):
         return BIFFRecords.UseSelfsRecord().get()
 
+    def __boundsheets_len(self):
+        boundsheets_len = 0
+        for sheet in self.__worksheets:
+            boundsheets_len += len(BIFFRecords.BoundSheetRecord(
+                0x00, sheet.visibility, sheet.name, self.encoding
+                ).get())
+        return boundsheets_len
+
     def __boundsheets_rec(self, data_len_before, data_len_after, sheet_biff_lens):
         #  .................................
         # BOUNDSEHEET0
@@ -587,13 +595,7 @@ class Workbook(object):
         # WORKSHEET0
         # WORKSHEET1
         # WORKSHEET2
-        boundsheets_len = 0
-        for sheet in self.__worksheets:
-            boundsheets_len += len(BIFFRecords.BoundSheetRecord(
-                0x00, sheet.visibility, sheet.name, self.encoding
-                ).get())
-
-        start = data_len_before + boundsheets_len + data_len_after
+        start = data_len_before + self.__boundsheets_len() + data_len_after
 
         result = b''
         for sheet_biff_len,  sheet in zip(sheet_biff_lens, self.__worksheets):
@@ -640,33 +642,41 @@ class Workbook(object):
         #return BIFFRecords.ExtSSTRecord(abs_stream_pos, self.sst_record.str_placement,
         #self.sst_record.portions_len).get()
 
-    def get_biff_data(self):
-        before = b''
-        before += self.__bof_rec()
-        before += self.__intf_hdr_rec()
-        before += self.__intf_mms_rec()
-        before += self.__intf_end_rec()
-        before += self.__write_access_rec()
-        before += self.__codepage_rec()
-        before += self.__dsf_rec()
-        before += self.__tabid_rec()
-        before += self.__fngroupcount_rec()
-        before += self.__wnd_protect_rec()
-        before += self.__protect_rec()
-        before += self.__obj_protect_rec()
-        before += self.__password_rec()
-        before += self.__prot4rev_rec()
-        before += self.__prot4rev_pass_rec()
-        before += self.__backup_rec()
-        before += self.__hide_obj_rec()
-        before += self.__window1_rec()
-        before += self.__datemode_rec()
-        before += self.__precision_rec()
-        before += self.__refresh_all_rec()
-        before += self.__bookbool_rec()
-        before += self.__all_fonts_num_formats_xf_styles_rec()
-        before += self.__palette_rec()
-        before += self.__useselfs_rec()
+    def get_biff_chunks(self):
+        """
+        Returns the length of the BIFF stream and an iterator of its chunks.
+        Sizes of all parts are computed first, so BOUNDSHEET offsets are
+        known before anything is written, and rows flushed to temporary
+        files are read back in chunks. The whole stream is never built
+        in memory.
+        """
+        before = b''.join([
+            self.__bof_rec(),
+            self.__intf_hdr_rec(),
+            self.__intf_mms_rec(),
+            self.__intf_end_rec(),
+            self.__write_access_rec(),
+            self.__codepage_rec(),
+            self.__dsf_rec(),
+            self.__tabid_rec(),
+            self.__fngroupcount_rec(),
+            self.__wnd_protect_rec(),
+            self.__protect_rec(),
+            self.__obj_protect_rec(),
+            self.__password_rec(),
+            self.__prot4rev_rec(),
+            self.__prot4rev_pass_rec(),
+            self.__backup_rec(),
+            self.__hide_obj_rec(),
+            self.__window1_rec(),
+            self.__datemode_rec(),
+            self.__precision_rec(),
+            self.__refresh_all_rec(),
+            self.__bookbool_rec(),
+            self.__all_fonts_num_formats_xf_styles_rec(),
+            self.__palette_rec(),
+            self.__useselfs_rec(),
+            ])
 
         country            = self.__country_rec()
         all_links          = self.__all_links_rec()
@@ -678,19 +688,39 @@ class Workbook(object):
         eof = self.__eof_rec()
 
         self.__worksheets[self.__active_sheet].selected = True
-        sheets = b''
+        sheet_parts = []
         sheet_biff_lens = []
+        # sheets start after globals, INDEX records need their positions
+        stream_pos = (len(before) + self.__boundsheets_len() + len(after) +
+                      len(ext_sst) + len(eof))
         for sheet in self.__worksheets:
-            data = sheet.get_biff_data()
-            sheets += data
-            sheet_biff_lens.append(len(data))
+            head, tail = sheet.get_biff_parts(stream_pos)
+            sheet_parts.append((head, sheet, tail))
+            sheet_biff_lens.append(len(head) + sheet.row_data_size() + len(tail))
+            stream_pos += sheet_biff_lens[-1]
 
         bundlesheets = self.__boundsheets_rec(len(before), len(after)+len(ext_sst)+len(eof), sheet_biff_lens)
 
         sst_stream_pos = len(before) + len(bundlesheets) + len(country)  + len(all_links)
         ext_sst = self.__ext_sst_rec(sst_stream_pos)
 
-        return before + bundlesheets + after + ext_sst + eof + sheets
+        globals_data = [before, bundlesheets, after, ext_sst, eof]
+        length = sum(len(data) for data in globals_data) + sum(sheet_biff_lens)
+
+        def chunks():
+            for data in globals_data:
+                yield data
+            for head, sheet, tail in sheet_parts:
+                yield head
+                for chunk in sheet.iter_row_data():
+                    yield chunk
+                yield tail
+
+        return length, chunks()
+
+    def get_biff_data(self):
+        length, chunks = self.get_biff_chunks()
+        return b''.join(chunks)
 
     def save(self, filename_or_stream):
         """
@@ -707,6 +737,7 @@ class Workbook(object):
         from . import CompoundDoc
 
         doc = CompoundDoc.XlsDoc()
-        doc.save(filename_or_stream, self.get_biff_data())
+        length, chunks = self.get_biff_chunks()
+        doc.save_chunks(filename_or_stream, chunks, length)
 
 
@@ -37,7 +37,7 @@ from . import Bitmap
 from . import Style
 from .Row import Row
 from .Column import Column
-from .compat import unicode, itervalues
+from .compat import unicode
 import tempfile
 
 class Worksheet(object):
@@ -52,6 +52,8 @@ class Worksheet(object):
     """
     # a safe default value, 3 is always valid!
     active_pane = 3
+    # rows of a Row Block, every block ends with DBCELL record
+    ROW_BLOCK = 32
     
     #################################################################
     ## Constructor
@@ -201,6 +203,7 @@ class Worksheet(object):
         self.first_used_col = 255
         self.row_tempfile = None
         self.__flushed_rows = {}
+        self.__dbcell_offsets = []
         self.__row_visible_levels = 0
 
     #################################################################
@@ -1306,11 +1309,35 @@ class Worksheet(object):
         return result
 
     def __row_blocks_rec(self):
+        # Rows in index order, in blocks of ROW_BLOCK rows: ROW records,
+        # cell records, DBCELL. Returns data and offsets of DBCELL records
+        # in it, INDEX record needs their stream positions.
         result = []
-        for row in itervalues(self.__rows):
-            result.append(row.get_row_biff_data())
-            result.append(row.get_cells_biff_data())
-        return b''.join(result)
+        dbcells = []
+        pos = 0
+        rows = [self.__rows[rowx] for rowx in sorted(self.__rows)]
+        start = 0
+        while start < len(rows):
+            blockx = rows[start].get_index() // self.ROW_BLOCK
+            end = start + 1
+            while (end < len(rows) and
+                    rows[end].get_index() // self.ROW_BLOCK == blockx):
+                end += 1
+            block = rows[start:end]
+            row_recs = [row.get_row_biff_data() for row in block]
+            cell_recs = [row.get_cells_biff_data() for row in block]
+            # first offset is counted from the second ROW record, others
+            # from the first cell record of previous row
+            offsets = [sum(len(rec) for rec in row_recs[1:])]
+            offsets += [len(rec) for rec in cell_recs[:-1]]
+            block_len = sum(len(rec) for rec in row_recs + cell_recs)
+            result.extend(row_recs)
+            result.extend(cell_recs)
+            result.append(BIFFRecords.DbCellRecord(block_len, offsets).get())
+            dbcells.append(pos + block_len)
+            pos += len(result[-1]) + block_len
+            start = end
+        return b''.join(result), dbcells
 
     def __merged_rec(self):
         return BIFFRecords.MergedCellsRecord(self.__merged_ranges).get()
@@ -1377,41 +1404,80 @@ class Worksheet(object):
         result += BIFFRecords.PasswordRecord(self.__password).get()
         return result
 
-    def get_biff_data(self):
-        result = [
-            self.__bof_rec(),
+    def get_biff_parts(self, stream_pos=0):
+        # Records before and after flushed rows. Flushed rows stay in
+        # row_tempfile, see iter_row_data(). stream_pos is the position of
+        # BOF in the workbook stream: INDEX keeps absolute positions of
+        # DEFCOLWIDTH (COLINFO here) and DBCELL records.
+        rows, dbcells = self.__row_blocks_rec()
+        bof = self.__bof_rec()
+        settings = b''.join([
             self.__calc_settings_rec(),
             self.__guts_rec(),
             self.__defaultrowheight_rec(),
             self.__wsbool_rec(),
+            ])
+        sizes = b''.join([
             self.__colinfo_rec(),
             self.__dimensions_rec(),
             self.__print_settings_rec(),
             self.__protection_rec(),
-            ]
-        if self.row_tempfile:
-            self.row_tempfile.flush()
-            self.row_tempfile.seek(0)
-            result.append(self.row_tempfile.read())
-            self.row_tempfile.seek(0, 2) # to EOF
-            # Above seek() is necessary to avoid a spurious IOError
-            # with Errno 0 if the caller continues on writing rows
-            # and flushing row data after the save().
-            # See https://bugs.python.org/issue3207
-        result.extend([
-            self.__row_blocks_rec(),
+            ])
+        blocks = len(self.__dbcell_offsets) + len(dbcells)
+        index_len = 4 + 16 + 4 * min(blocks, BIFFRecords.IndexRecord.MAX_BLOCKS)
+        defcolwidth_pos = stream_pos + len(bof) + index_len + len(settings)
+        rows_pos = defcolwidth_pos + len(sizes)
+        tail_pos = rows_pos + self.row_data_size()
+        positions = [rows_pos + offset for offset in self.__dbcell_offsets]
+        positions += [tail_pos + offset for offset in dbcells]
+        index = BIFFRecords.IndexRecord(self.first_used_row,
+            self.last_used_row, defcolwidth_pos, positions).get()
+        head = b''.join([bof, index, settings, sizes])
+        tail = b''.join([
+            rows,
             self.__merged_rec(),
             self.__bitmaps_rec(),
             self.__window2_rec(),
             self.__panes_rec(),
             self.__eof_rec(),
             ])
-        return b''.join(result)
+        return head, tail
+
+    def row_data_size(self):
+        if not self.row_tempfile:
+            return 0
+        self.row_tempfile.flush()
+        return self.row_tempfile.seek(0, 2)
+
+    def iter_row_data(self, chunk_size=0x100000):
+        if not self.row_tempfile:
+            return
+        self.row_tempfile.flush()
+        self.row_tempfile.seek(0)
+        try:
+            while True:
+                chunk = self.row_tempfile.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self.row_tempfile.seek(0, 2) # to EOF
+            # Above seek() is necessary to avoid a spurious IOError
+            # with Errno 0 if the caller continues on writing rows
+            # and flushing row data after the save().
+            # See https://bugs.python.org/issue3207
+
+    def get_biff_data(self):
+        head, tail = self.get_biff_parts()
+        return b''.join([head] + list(self.iter_row_data()) + [tail])
 
     def flush_row_data(self):
         if self.row_tempfile is None:
             self.row_tempfile = tempfile.TemporaryFile()
-        self.row_tempfile.write(self.__row_blocks_rec())
+        rows, dbcells = self.__row_blocks_rec()
+        offset = self.row_data_size()
+        self.row_tempfile.write(rows)
+        self.__dbcell_offsets.extend(offset + dbcell for dbcell in dbcells)
         for rowx in self.__rows:
             self.__flushed_rows[rowx] = 1
         self.__update_row_visible_levels()
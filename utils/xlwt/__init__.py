@@ -6,4 +6,17 @@ from .Row import Row
 from .Column import Column
 from .Formatting import Font, Alignment, Borders, Pattern, Protection
 from .Style import XFStyle, easyxf, easyfont, add_palette_colour
-from .ExcelFormula import *
+
+# Formula parser and antlr runtime are heavy and rarely used, they are
+# imported on first access to xlwt.Formula.
+_FORMULA_NAMES = ('Formula', 'ExcelFormulaParser', 'ExcelFormulaLexer',
+                  'ANTLRException')
+
+
+def __getattr__(name):
+    if name in _FORMULA_NAMES:
+        from . import ExcelFormula
+        value = getattr(ExcelFormula, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))